@@ -0,0 +1,41 @@
+"""Add (tenant_id, id) indexes for RLS-scoped tables
+
+Revision ID: 0001_tenant_pk_indexes
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_tenant_pk_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Tables filtered by the tenant RLS predicate; all use "id" as primary key
+TENANT_TABLES = (
+    "audit_logs",
+    "consent_records",
+    "dia_cari_kartlar",
+    "dia_stok_kartlar",
+    "dia_fatura_fisler",
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in TENANT_TABLES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "ix_{table}_tenant_id_id" '
+                f'ON "{table}" (tenant_id, id)'
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TENANT_TABLES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "ix_{table}_tenant_id_id"')
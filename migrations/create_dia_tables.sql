@@ -141,21 +141,22 @@ ALTER TABLE dia_fatura_fisler ENABLE ROW LEVEL SECURITY;
 
 -- Create RLS policies for DIA tables
 -- These policies ensure tenants can only access their own data
+-- The setting is wrapped in a sub-select so it is evaluated once per query (InitPlan), not per row
 
 -- Cari Kartlar RLS policies
 CREATE POLICY dia_cari_kartlar_tenant_isolation ON dia_cari_kartlar
     FOR ALL TO application_user
-    USING (tenant_id = current_setting('app.current_tenant')::uuid);
+    USING (tenant_id = (SELECT current_setting('app.current_tenant', true)::uuid));
 
 -- Stok Kartlar RLS policies  
 CREATE POLICY dia_stok_kartlar_tenant_isolation ON dia_stok_kartlar
     FOR ALL TO application_user
-    USING (tenant_id = current_setting('app.current_tenant')::uuid);
+    USING (tenant_id = (SELECT current_setting('app.current_tenant', true)::uuid));
 
 -- Fatura Fişleri RLS policies
 CREATE POLICY dia_fatura_fisler_tenant_isolation ON dia_fatura_fisler
     FOR ALL TO application_user
-    USING (tenant_id = current_setting('app.current_tenant')::uuid);
+    USING (tenant_id = (SELECT current_setting('app.current_tenant', true)::uuid));
 
 -- Create function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_dia_updated_at_column()
@@ -0,0 +1,63 @@
+"""
+Shared endpoint error handling for Turkish Business Integration Platform API
+"""
+
+import functools
+from typing import Dict
+
+from fastapi import HTTPException, status
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def error_detail(error: str, message: str, message_en: str) -> Dict[str, str]:
+    """
+    Build a bilingual error body for HTTPException detail
+    
+    Details can be built once as module constants; raise a new HTTPException
+    with them on each failure, since a stored exception instance would carry
+    its traceback across concurrent requests.
+    
+    Args:
+        error: Error code returned to the client
+        message: Turkish error message
+        message_en: English error message
+        
+    Returns:
+        Dict[str, str]: Error detail dict
+    """
+    return {
+        "error": error,
+        "message": message,
+        "message_en": message_en
+    }
+
+
+def handle_endpoint_errors(log_event: str, error: str, message: str, message_en: str):
+    """
+    Map unexpected endpoint failures to a bilingual 500 response
+    
+    HTTPExceptions raised by the endpoint pass through unchanged.
+    
+    Args:
+        log_event: Log event name for the failure
+        error: Error code returned to the client
+        message: Turkish error message
+        message_en: English error message
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(log_event, error=str(e))
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=error_detail(error, message, message_en)
+                )
+        return wrapper
+    return decorator
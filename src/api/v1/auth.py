@@ -15,6 +15,7 @@ from src.core.security import (
     PasswordService, 
     AuthenticationError, 
     TokenExpiredError,
+    AuthUser,
     get_current_user,
     get_current_active_user
 )
@@ -352,20 +353,20 @@ async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
 
 
 @router.get("/me")
-async def get_current_user_info(current_user: Dict[str, Any] = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: AuthUser = Depends(get_current_active_user)):
     """
     Get current user information
     """
     return {
         "success": True,
-        "user": current_user
+        "user": current_user.claims
     }
 
 
 @router.post("/change-password")
 async def change_password(
     request: PasswordChangeRequest,
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: AuthUser = Depends(get_current_active_user)
 ):
     """
     Change user password
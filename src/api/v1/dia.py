@@ -2,14 +2,15 @@
 DIA ERP Integration API Endpoints
 """
 
-from typing import Dict, Any, Optional, List
-from uuid import UUID
+from typing import Annotated, AsyncIterator, Awaitable, Callable, Dict, Any, Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+import orjson
 import structlog
 
-from src.core.security import get_current_user, require_permissions
+from src.core.security import AuthUser, get_current_active_user, require_permissions
 from src.services.tenant_service import tenant_service
 from src.integrations.dia.connector import DIAConnector
 from src.integrations.dia.services import DIAService
@@ -20,6 +21,15 @@ from src.integrations.base_connector import ConnectorResponse
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# NDJSON export chunks are flushed once they reach this size
+CARI_KART_STREAM_FLUSH_BYTES = 64 * 1024
+
+# Sync module name -> unbound DIAService method, in sync order
+SYNC_OPERATIONS: Dict[str, Callable[..., Awaitable[ConnectorResponse]]] = {
+    "cari_kartlar": DIAService.sync_cari_kartlar,
+    "stok_kartlar": DIAService.sync_stok_kartlar,
+}
+
 
 # Request/Response Models
 class DIAConnectionRequest(BaseModel):
@@ -60,11 +70,11 @@ class DIAQueryRequest(BaseModel):
 
 # Dependency functions
 async def get_dia_connector(
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ) -> DIAConnector:
     """Get DIA connector for current tenant"""
     try:
-        tenant_id = current_user["tenant_id"]
+        tenant_id = current_user.tenant_id_str
         
         # Get DIA config for tenant
         config_result = await tenant_service.get_integration_config(tenant_id, "dia")
@@ -90,7 +100,7 @@ async def get_dia_connector(
         return DIAConnector(dia_config)
         
     except Exception as e:
-        logger.error("Failed to create DIA connector", error=str(e), tenant_id=current_user.get("tenant_id"))
+        logger.error("Failed to create DIA connector", error=str(e), tenant_id=current_user.tenant_id_str)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -111,8 +121,8 @@ async def get_dia_service(
 # API Endpoints
 @router.post("/test-connection")
 async def test_dia_connection(
-    connector: DIAConnector = Depends(get_dia_connector),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:read"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))],
+    connector: DIAConnector = Depends(get_dia_connector)
 ):
     """
     Test DIA connection
@@ -144,13 +154,13 @@ async def test_dia_connection(
 @router.post("/setup")
 async def setup_dia_integration(
     request: DIAConnectionRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:write"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:write"]))]
 ):
     """
     Setup DIA integration for current tenant
     """
     try:
-        tenant_id = current_user["tenant_id"]
+        tenant_id = current_user.tenant_id_str
         
         # Test connection first
         test_config = DIAConfig(
@@ -223,8 +233,8 @@ async def setup_dia_integration(
 
 @router.get("/info")
 async def get_dia_info(
-    connector: DIAConnector = Depends(get_dia_connector),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:read"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))],
+    connector: DIAConnector = Depends(get_dia_connector)
 ):
     """
     Get DIA system information
@@ -270,40 +280,30 @@ async def get_dia_info(
 @router.post("/sync")
 async def sync_dia_data(
     request: DIASyncRequest,
-    dia_service: DIAService = Depends(get_dia_service),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:write"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:write"]))],
+    dia_service: DIAService = Depends(get_dia_service)
 ):
     """
     Sync data from DIA to local database
     """
     try:
-        tenant_id = UUID(current_user["tenant_id"])
+        tenant_id = current_user.tenant_id
         results = {}
         
         # Sync requested modules
-        if "cari_kartlar" in request.modules:
-            logger.info("Syncing cari kartlar", tenant_id=str(tenant_id))
-            result = await dia_service.sync_cari_kartlar(
-                tenant_id=tenant_id,
-                firma_kodu=request.firma_kodu,
-                donem_kodu=request.donem_kodu,
-                limit=request.limit
-            )
-            results["cari_kartlar"] = {
-                "success": result.success,
-                "data": result.data,
-                "error": result.error
-            }
-        
-        if "stok_kartlar" in request.modules:
-            logger.info("Syncing stok kartlar", tenant_id=str(tenant_id))
-            result = await dia_service.sync_stok_kartlar(
+        for module, sync in SYNC_OPERATIONS.items():
+            if module not in request.modules:
+                continue
+            
+            logger.info("Syncing DIA module", module=module, tenant_id=str(tenant_id))
+            result = await sync(
+                dia_service,
                 tenant_id=tenant_id,
                 firma_kodu=request.firma_kodu,
                 donem_kodu=request.donem_kodu,
                 limit=request.limit
             )
-            results["stok_kartlar"] = {
+            results[module] = {
                 "success": result.success,
                 "data": result.data,
                 "error": result.error
@@ -339,14 +339,14 @@ async def sync_dia_data(
 
 @router.get("/sync-status")
 async def get_sync_status(
-    dia_service: DIAService = Depends(get_dia_service),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:read"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))],
+    dia_service: DIAService = Depends(get_dia_service)
 ):
     """
     Get synchronization status
     """
     try:
-        tenant_id = UUID(current_user["tenant_id"])
+        tenant_id = current_user.tenant_id
         result = await dia_service.get_sync_status(tenant_id)
         
         return {
@@ -372,15 +372,15 @@ async def get_sync_status(
 # Cari Kart Endpoints
 @router.get("/cari-kartlar")
 async def list_cari_kartlar(
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))],
     query: DIAQueryRequest = Depends(),
-    dia_service: DIAService = Depends(get_dia_service),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:read"]))
+    dia_service: DIAService = Depends(get_dia_service)
 ):
     """
     List cari kartlar from local database
     """
     try:
-        tenant_id = UUID(current_user["tenant_id"])
+        tenant_id = current_user.tenant_id
         result = await dia_service.get_cari_kartlar(
             tenant_id=tenant_id,
             firma_kodu=query.firma_kodu,
@@ -409,17 +409,98 @@ async def list_cari_kartlar(
         )
 
 
+async def _stream_cari_kart_lines(
+    records: AsyncIterator[Dict[str, Any]],
+    first_record: Optional[Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Encode streamed cari kartlar as NDJSON, flushing in ~64 KB chunks
+    
+    The response status is already sent, so a read failure after the first
+    record ends the stream with a terminal ``{"error": ...}`` line.
+    """
+    buffer = bytearray()
+    try:
+        record = first_record
+        while record is not None:
+            buffer += orjson.dumps(record)
+            buffer += b"\n"
+            if len(buffer) >= CARI_KART_STREAM_FLUSH_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+            record = await anext(records, None)
+    except Exception as e:
+        logger.error("Stream cari kartlar failed", error=str(e))
+        buffer += orjson.dumps({
+            "error": "stream_error",
+            "message": "Cari kart akışı yarıda kesildi",
+            "message_en": "Cari kart stream interrupted"
+        })
+        buffer += b"\n"
+    finally:
+        await records.aclose()
+    
+    if buffer:
+        yield bytes(buffer)
+
+
+@router.get("/cari-kartlar/stream")
+async def stream_cari_kartlar(
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))],
+    firma_kodu: Optional[int] = Query(None, description="Firma kodu"),
+    carikarttipi: Optional[str] = Query(None, pattern="^(AL|SAT|ALSAT)$"),
+    aktif: Optional[bool] = Query(None),
+    search: Optional[str] = Query(None, max_length=100),
+    dia_service: DIAService = Depends(get_dia_service)
+):
+    """
+    Stream all matching cari kartlar from local database as NDJSON (one record per line)
+    
+    The first record is read before the response starts, so query and
+    connection failures are reported as 500 instead of an empty stream.
+    """
+    filters = {
+        key: value
+        for key, value in (("carikarttipi", carikarttipi), ("aktif", aktif), ("search", search))
+        if value is not None
+    }
+    
+    records = dia_service.iter_cari_kartlar(
+        tenant_id=current_user.tenant_id,
+        firma_kodu=firma_kodu,
+        filters=filters
+    )
+    try:
+        first_record = await anext(records, None)
+    except Exception as e:
+        await records.aclose()
+        logger.error("Stream cari kartlar failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "stream_error",
+                "message": "Cari kartlar alınamadı",
+                "message_en": "Failed to stream cari kartlar"
+            }
+        )
+    
+    return StreamingResponse(
+        _stream_cari_kart_lines(records, first_record),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.post("/cari-kartlar")
 async def create_cari_kart(
     request: DIACariKartRequest,
-    dia_service: DIAService = Depends(get_dia_service),
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:write"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:write"]))],
+    dia_service: DIAService = Depends(get_dia_service)
 ):
     """
     Create new cari kart in DIA
     """
     try:
-        tenant_id = UUID(current_user["tenant_id"])
+        tenant_id = current_user.tenant_id
         cari_data = request.dict(exclude={"firma_kodu", "donem_kodu"})
         
         result = await dia_service.create_cari_kart(
@@ -462,13 +543,13 @@ async def create_cari_kart(
 
 @router.get("/status")
 async def get_dia_status(
-    current_user: Dict[str, Any] = Depends(require_permissions(["integrations:read"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["integrations:read"]))]
 ):
     """
     Get DIA integration status
     """
     try:
-        tenant_id = current_user["tenant_id"]
+        tenant_id = current_user.tenant_id_str
         
         # Check if DIA is configured
         config_result = await tenant_service.get_integration_config(tenant_id, "dia")
@@ -16,6 +16,7 @@ from src.core.security import get_current_user, require_permissions
 from src.database import get_session
 from src.services.tenant_service import tenant_service
 from src.config import settings
+from src.utils.monitoring import get_cpu_percent
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -151,14 +152,14 @@ async def detailed_health_check(
     
     # System metrics
     try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage, sampled in the background
+        cpu_percent = get_cpu_percent()
         
-        # Memory usage
-        memory = psutil.virtual_memory()
-        
-        # Disk usage
-        disk = psutil.disk_usage('/')
+        # Memory and disk usage read /proc and the filesystem off the event loop
+        memory, disk = await asyncio.gather(
+            asyncio.to_thread(psutil.virtual_memory),
+            asyncio.to_thread(psutil.disk_usage, '/')
+        )
         
         checks["system"] = {
             "status": "healthy",
@@ -232,7 +233,7 @@ async def detailed_health_check(
     
     return {
         "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "version": "1.0.0",
         "environment": settings.environment,
         "debug_mode": settings.debug,
@@ -258,7 +259,7 @@ async def readiness_check():
         
         return {
             "status": "ready",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
         
     except Exception as e:
@@ -280,7 +281,7 @@ async def liveness_check():
     """
     return {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "uptime": time.time() - getattr(liveness_check, '_start_time', time.time())
     }
 
@@ -301,7 +302,7 @@ async def get_metrics(
         tenant_usage = usage_result.get("usage", {}) if usage_result["success"] else {}
         
         # System metrics
-        cpu_percent = psutil.cpu_percent()
+        cpu_percent = get_cpu_percent()
         memory = psutil.virtual_memory()
         
         # Process metrics
@@ -309,7 +310,7 @@ async def get_metrics(
         process_memory = process.memory_info()
         
         metrics = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "tenant_metrics": {
                 "tenant_id": str(tenant_id),
                 "sms_sent_today": tenant_usage.get("sms_today", 0),
@@ -372,7 +373,7 @@ async def get_application_logs(
         # You would implement actual log reading logic here
         logs = [
             {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "level": "INFO",
                 "logger": "uvicorn.access",
                 "message": "Application health check endpoint accessed",
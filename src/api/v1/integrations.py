@@ -2,128 +2,327 @@
 Integration endpoints for Turkish Business Integration Platform
 """
 
-from typing import Dict, Any, List, Optional
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Annotated, Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+import orjson
+import redis.asyncio as redis
 import structlog
 
-from src.core.security import get_current_active_user, require_permissions
+from src.api.errors import error_detail
+from src.config import settings
+from src.core.security import AuthUser, get_current_active_user, require_permissions
 from src.integrations.netgsm import NetgsmConnector
-from src.integrations.base_connector import ConnectorConfig, ConnectorResponse
+from src.integrations.base_connector import ConnectorConfig, ConnectorResponse, ConnectorError
 from src.services.tenant_service import tenant_service
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Redis client for the per-tenant integration list snapshot (raw bytes)
+redis_client = redis.from_url(settings.redis_url)
+
+NETGSM_BASE_URL = "https://api.netgsm.com.tr"
+
+# Request constraints are compiled once into the models' core validators
+TURKISH_PHONE_PATTERN = r'^\+90[0-9]{10}$'
+INTEGRATION_TYPE_PATTERN = "^(netgsm|iyzico|efatura|bulutfon|arvento)$"
+TurkishPhone = Annotated[str, Field(pattern=TURKISH_PHONE_PATTERN)]
+
+# Permission dependencies, resolved once at import
+_DEP_CONFIG = require_permissions(["integration:config"])
+_DEP_TEST = require_permissions(["integration:test"])
+_DEP_SMS = require_permissions(["integration:sms"])
+_DEP_WHATSAPP = require_permissions(["integration:whatsapp"])
+_DEP_BULK_SMS = require_permissions(["integration:bulk_sms"])
+_DEP_REPORTS = require_permissions(["integration:reports"])
+
+# Flush streamed NDJSON report chunks once this many bytes are buffered
+REPORT_STREAM_FLUSH_BYTES = 64 * 1024
+
+# Cache key and TTL for the tenant integration snapshot
+TENANT_INTEGRATIONS_CACHE_KEY = "tenant_integrations:{tenant_id}"
+TENANT_INTEGRATIONS_CACHE_TTL = 120
+
+# Static integration catalogue, serialized once at import
+_AVAILABLE_INTEGRATIONS_BYTES = orjson.dumps([
+    {
+        "type": "netgsm",
+        "name": "NetGSM SMS & WhatsApp",
+        "description": "SMS ve WhatsApp mesajlaşma hizmeti",
+        "features": ["SMS", "WhatsApp", "Bulk SMS", "Delivery Reports"],
+        "status": "active"
+    },
+    {
+        "type": "iyzico",
+        "name": "Iyzico Payment",
+        "description": "Online ödeme ve sanal pos hizmeti",
+        "features": ["Credit Card", "Installments", "3D Secure", "Refunds"],
+        "status": "planned"
+    },
+    {
+        "type": "efatura",
+        "name": "E-Fatura",
+        "description": "Elektronik fatura entegrasyonu",
+        "features": ["Invoice Creation", "Invoice Query", "Tax Integration"],
+        "status": "planned"
+    },
+    {
+        "type": "bulutfon",
+        "name": "Bulutfon VoIP",
+        "description": "Bulut tabanlı telefon sistemi",
+        "features": ["Call Management", "IVR", "Call Recording"],
+        "status": "planned"
+    },
+    {
+        "type": "arvento",
+        "name": "Arvento Fleet",
+        "description": "Araç takip ve filo yönetimi",
+        "features": ["Vehicle Tracking", "Route Optimization", "Reports"],
+        "status": "planned"
+    }
+])
+
+# Static error details
+_NETGSM_NOT_CONFIGURED_DETAIL = error_detail(
+    "netgsm_not_configured",
+    "NetGSM entegrasyonu yapılandırılmamış",
+    "NetGSM integration not configured"
+)
+_GET_INTEGRATIONS_ERROR_DETAIL = error_detail(
+    "get_integrations_error",
+    "Entegrasyonlar alınırken hata oluştu",
+    "Error getting integrations"
+)
+_CONFIG_ERROR_DETAIL = error_detail(
+    "config_error",
+    "Entegrasyon yapılandırma sırasında hata oluştu",
+    "Error configuring integration"
+)
+_TEST_ERROR_DETAIL = error_detail(
+    "test_error",
+    "Entegrasyon test sırasında hata oluştu",
+    "Error testing integration"
+)
+_SMS_ERROR_DETAIL = error_detail(
+    "sms_error",
+    "SMS gönderme sırasında hata oluştu",
+    "Error sending SMS"
+)
+_WHATSAPP_ERROR_DETAIL = error_detail(
+    "whatsapp_error",
+    "WhatsApp gönderme sırasında hata oluştu",
+    "Error sending WhatsApp"
+)
+_BULK_SMS_ERROR_DETAIL = error_detail(
+    "bulk_sms_error",
+    "Toplu SMS gönderme sırasında hata oluştu",
+    "Error sending bulk SMS"
+)
+_REPORTS_ERROR_DETAIL = error_detail(
+    "reports_error",
+    "Rapor alma sırasında hata oluştu",
+    "Error getting reports"
+)
+_REPORTS_UPSTREAM_ERROR_DETAIL = error_detail(
+    "reports_upstream_error",
+    "NetGSM raporları alınamadı",
+    "Failed to fetch reports from NetGSM"
+)
+
 
 class SMSRequest(BaseModel):
     """SMS sending request"""
-    phone: str = Field(..., regex=r'^\+90[0-9]{10}$')
+    phone: TurkishPhone
     message: str = Field(..., min_length=1, max_length=160)
     sender_name: Optional[str] = Field(None, max_length=11)
     
     
 class WhatsAppRequest(BaseModel):
     """WhatsApp message request"""
-    phone: str = Field(..., regex=r'^\+90[0-9]{10}$')
+    phone: TurkishPhone
     message: str = Field(..., min_length=1, max_length=4096)
-    message_type: str = Field(default="text", regex="^(text|template)$")
+    message_type: str = Field(default="text", pattern="^(text|template)$")
     template_name: Optional[str] = None
     template_params: Optional[Dict[str, str]] = None
 
 
 class BulkSMSRequest(BaseModel):
     """Bulk SMS sending request"""
-    phones: List[str] = Field(..., min_items=1, max_items=1000)
+    phones: List[TurkishPhone] = Field(..., min_length=1, max_length=1000)
     message: str = Field(..., min_length=1, max_length=160)
     sender_name: Optional[str] = Field(None, max_length=11)
-    
-    @validator('phones')
-    def validate_phones(cls, v):
-        for phone in v:
-            if not phone.match(r'^\+90[0-9]{10}$'):
-                raise ValueError(f'Invalid phone format: {phone}')
-        return v
 
 
 class IntegrationConfigRequest(BaseModel):
     """Integration configuration request"""
-    integration_type: str = Field(..., regex="^(netgsm|iyzico|efatura|bulutfon|arvento)$")
-    config: Dict[str, Any] = Field(..., min_items=1)
+    integration_type: str = Field(..., pattern=INTEGRATION_TYPE_PATTERN)
+    config: Dict[str, Any] = Field(..., min_length=1)
     is_active: bool = Field(default=True)
 
 
 class IntegrationTestRequest(BaseModel):
     """Integration connection test request"""
-    integration_type: str = Field(..., regex="^(netgsm|iyzico|efatura|bulutfon|arvento)$")
+    integration_type: str = Field(..., pattern=INTEGRATION_TYPE_PATTERN)
+
+
+@dataclass(slots=True)
+class MessageResult:
+    """Provider result for a single SMS/WhatsApp message"""
+    message_id: Optional[str]
+    status_code: Optional[int]
+    error: Optional[str]
+
+
+@dataclass(slots=True)
+class SmsResponse:
+    """SMS sending response"""
+    success: bool
+    message: str
+    message_en: str
+    sms_result: MessageResult
+
+
+@dataclass(slots=True)
+class WhatsAppResponse:
+    """WhatsApp sending response"""
+    success: bool
+    message: str
+    message_en: str
+    whatsapp_result: MessageResult
+
+
+@dataclass(slots=True)
+class BulkSmsResult:
+    """Provider result for a bulk SMS send"""
+    total_count: int
+    successful_count: int
+    failed_count: int
+    status_code: Optional[int]
+    error: Optional[str]
+    details: Any
+
+
+@dataclass(slots=True)
+class BulkSmsResponse:
+    """Bulk SMS sending response"""
+    success: bool
+    message: str
+    message_en: str
+    bulk_result: BulkSmsResult
+
+
+def _json_response(content: Any) -> Response:
+    """Serialize a response dataclass with orjson, bypassing response_model validation"""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+def _message_result(result: ConnectorResponse) -> MessageResult:
+    """Extract the single-message result fields from a connector response"""
+    return MessageResult(
+        result.data.get("message_id") if result.data else None,
+        result.status_code,
+        result.error
+    )
+
+
+async def _check_quota(
+    tenant_id: UUID,
+    resource: str,
+    amount: int,
+    message_tr: str,
+    message_en: str
+) -> None:
+    """Raise 429 if the tenant has no quota left for resource"""
+    quota_result = await tenant_service.check_quota(tenant_id, resource, amount)
+    if not quota_result["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "error": "quota_exceeded",
+                "message": quota_result.get("message", message_tr),
+                "message_en": quota_result.get("message_en", message_en)
+            }
+        )
+
+
+async def _get_netgsm_config(tenant_id: UUID) -> Dict[str, Any]:
+    """Get tenant NetGSM configuration, raising 404 if not configured"""
+    config_result = await tenant_service.get_integration_config(tenant_id, "netgsm")
+    
+    if not config_result["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_NETGSM_NOT_CONFIGURED_DETAIL
+        )
+    
+    return config_result["config"]
+
+
+def _netgsm_connector_config(config: Dict[str, Any]) -> ConnectorConfig:
+    """Build NetGSM connector configuration from tenant config"""
+    return ConnectorConfig(
+        base_url=NETGSM_BASE_URL,
+        username=config.get("username"),
+        password=config.get("password")
+    )
 
 
 @router.get("/")
 async def get_integrations(
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Get available integrations for tenant
     """
     try:
-        tenant_id = current_user["tenant_id"]
-        
-        # Get tenant integration configurations
-        result = await tenant_service.get_tenant_integrations(tenant_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "get_integrations_error",
-                    "message": result.get("message", "Entegrasyonlar alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get integrations")
-                }
-            )
-        
-        return {
-            "success": True,
-            "integrations": result["integrations"],
-            "available_integrations": [
-                {
-                    "type": "netgsm",
-                    "name": "NetGSM SMS & WhatsApp",
-                    "description": "SMS ve WhatsApp mesajlaşma hizmeti",
-                    "features": ["SMS", "WhatsApp", "Bulk SMS", "Delivery Reports"],
-                    "status": "active"
-                },
-                {
-                    "type": "iyzico", 
-                    "name": "Iyzico Payment",
-                    "description": "Online ödeme ve sanal pos hizmeti",
-                    "features": ["Credit Card", "Installments", "3D Secure", "Refunds"],
-                    "status": "planned"
-                },
-                {
-                    "type": "efatura",
-                    "name": "E-Fatura",
-                    "description": "Elektronik fatura entegrasyonu",
-                    "features": ["Invoice Creation", "Invoice Query", "Tax Integration"],
-                    "status": "planned"
-                },
-                {
-                    "type": "bulutfon",
-                    "name": "Bulutfon VoIP",
-                    "description": "Bulut tabanlı telefon sistemi",
-                    "features": ["Call Management", "IVR", "Call Recording"],
-                    "status": "planned"
-                },
-                {
-                    "type": "arvento",
-                    "name": "Arvento Fleet",
-                    "description": "Araç takip ve filo yönetimi",
-                    "features": ["Vehicle Tracking", "Route Optimization", "Reports"],
-                    "status": "planned"
-                }
-            ]
-        }
+        tenant_id = current_user.tenant_id
+        cache_key = TENANT_INTEGRATIONS_CACHE_KEY.format(tenant_id=current_user.tenant_id_str)
+        
+        # The cache is best effort; a Redis outage falls through to the DB
+        try:
+            integrations_bytes = await redis_client.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning("Integrations cache read failed", error=str(e))
+            integrations_bytes = None
+        
+        if integrations_bytes is None:
+            # Get tenant integration configurations
+            result = await tenant_service.get_tenant_integrations(tenant_id)
+            
+            if not result["success"]:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail={
+                        "error": "get_integrations_error",
+                        "message": result.get("message", "Entegrasyonlar alınamadı"),
+                        "message_en": result.get("message_en", "Failed to get integrations")
+                    }
+                )
+            
+            integrations_bytes = orjson.dumps(result["integrations"])
+            try:
+                await redis_client.setex(
+                    cache_key,
+                    TENANT_INTEGRATIONS_CACHE_TTL,
+                    integrations_bytes
+                )
+            except redis.RedisError as e:
+                logger.warning("Integrations cache write failed", error=str(e))
+        
+        return Response(
+            content=(
+                b'{"success":true,"integrations":' + integrations_bytes
+                + b',"available_integrations":' + _AVAILABLE_INTEGRATIONS_BYTES + b'}'
+            ),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -131,25 +330,22 @@ async def get_integrations(
         logger.error("Get integrations error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "get_integrations_error",
-                "message": "Entegrasyonlar alınırken hata oluştu",
-                "message_en": "Error getting integrations"
-            }
-        )
+            detail=_GET_INTEGRATIONS_ERROR_DETAIL
+        ) from None
 
 
 @router.post("/config")
 async def configure_integration(
     request: IntegrationConfigRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:config"]))
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[AuthUser, Depends(_DEP_CONFIG)]
 ):
     """
     Configure integration for tenant (admin only)
     """
     try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
+        tenant_id = current_user.tenant_id
+        user_id = current_user.sub
         
         result = await tenant_service.configure_integration(
             tenant_id=tenant_id,
@@ -169,11 +365,19 @@ async def configure_integration(
                 }
             )
         
-        logger.info(
+        try:
+            await redis_client.delete(
+                TENANT_INTEGRATIONS_CACHE_KEY.format(tenant_id=current_user.tenant_id_str)
+            )
+        except redis.RedisError as e:
+            logger.warning("Integrations cache invalidation failed", error=str(e))
+        
+        background_tasks.add_task(
+            logger.info,
             "Integration configured",
-            tenant_id=str(tenant_id),
+            tenant_id=current_user.tenant_id_str,
             integration_type=request.integration_type,
-            configured_by=str(user_id)
+            configured_by=current_user.sub_str
         )
         
         return {
@@ -189,24 +393,21 @@ async def configure_integration(
         logger.error("Configure integration error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "config_error",
-                "message": "Entegrasyon yapılandırma sırasında hata oluştu",
-                "message_en": "Error configuring integration"
-            }
-        )
+            detail=_CONFIG_ERROR_DETAIL
+        ) from None
 
 
 @router.post("/test")
 async def test_integration(
     request: IntegrationTestRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:test"]))
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[AuthUser, Depends(_DEP_TEST)]
 ):
     """
     Test integration connection (admin only)
     """
     try:
-        tenant_id = current_user["tenant_id"]
+        tenant_id = current_user.tenant_id
         
         # Get integration config for tenant
         config_result = await tenant_service.get_integration_config(
@@ -228,13 +429,7 @@ async def test_integration(
         
         # Test connection based on integration type
         if request.integration_type == "netgsm":
-            connector_config = ConnectorConfig(
-                base_url="https://api.netgsm.com.tr",
-                username=config.get("username"),
-                password=config.get("password")
-            )
-            
-            async with NetgsmConnector(connector_config) as connector:
+            async with NetgsmConnector(_netgsm_connector_config(config)) as connector:
                 result = await connector.test_connection()
         else:
             # Other integrations would be implemented here
@@ -245,9 +440,10 @@ async def test_integration(
                 message_en="This integration is not implemented yet"
             )
         
-        logger.info(
+        background_tasks.add_task(
+            logger.info,
             "Integration tested",
-            tenant_id=str(tenant_id),
+            tenant_id=current_user.tenant_id_str,
             integration_type=request.integration_type,
             success=result.success
         )
@@ -270,60 +466,31 @@ async def test_integration(
         logger.error("Test integration error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "test_error",
-                "message": "Entegrasyon test sırasında hata oluştu",
-                "message_en": "Error testing integration"
-            }
-        )
+            detail=_TEST_ERROR_DETAIL
+        ) from None
 
 
 @router.post("/netgsm/sms")
 async def send_sms(
     request: SMSRequest,
     background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:sms"]))
+    current_user: Annotated[AuthUser, Depends(_DEP_SMS)]
 ):
     """
     Send SMS via NetGSM
     """
     try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
+        tenant_id = current_user.tenant_id
+        user_id = current_user.sub
         
         # Check SMS quota
-        quota_result = await tenant_service.check_quota(tenant_id, "sms", 1)
-        if not quota_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "quota_exceeded",
-                    "message": quota_result.get("message", "SMS kotası aşıldı"),
-                    "message_en": quota_result.get("message_en", "SMS quota exceeded")
-                }
-            )
+        await _check_quota(tenant_id, "sms", 1, "SMS kotası aşıldı", "SMS quota exceeded")
         
         # Get NetGSM configuration
-        config_result = await tenant_service.get_integration_config(tenant_id, "netgsm")
-        
-        if not config_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "netgsm_not_configured",
-                    "message": "NetGSM entegrasyonu yapılandırılmamış",
-                    "message_en": "NetGSM integration not configured"
-                }
-            )
-        
-        config = config_result["config"]
+        config = await _get_netgsm_config(tenant_id)
         
         # Create connector and send SMS
-        connector_config = ConnectorConfig(
-            base_url="https://api.netgsm.com.tr",
-            username=config.get("username"),
-            password=config.get("password")
-        )
+        connector_config = _netgsm_connector_config(config)
         
         async with NetgsmConnector(connector_config) as connector:
             result = await connector.send_sms(
@@ -341,24 +508,21 @@ async def send_sms(
             user_id
         )
         
-        logger.info(
+        background_tasks.add_task(
+            logger.info,
             "SMS sent",
-            tenant_id=str(tenant_id),
+            tenant_id=current_user.tenant_id_str,
             phone=request.phone,
             success=result.success,
-            user_id=str(user_id)
+            user_id=current_user.sub_str
         )
         
-        return {
-            "success": result.success,
-            "message": result.message_tr or ("SMS gönderildi" if result.success else "SMS gönderilemedi"),
-            "message_en": result.message_en or ("SMS sent" if result.success else "SMS failed"),
-            "sms_result": {
-                "message_id": result.data.get("message_id") if result.data else None,
-                "status_code": result.status_code,
-                "error": result.error
-            }
-        }
+        return _json_response(SmsResponse(
+            result.success,
+            result.message_tr or ("SMS gönderildi" if result.success else "SMS gönderilemedi"),
+            result.message_en or ("SMS sent" if result.success else "SMS failed"),
+            _message_result(result)
+        ))
         
     except HTTPException:
         raise
@@ -366,60 +530,31 @@ async def send_sms(
         logger.error("Send SMS error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "sms_error",
-                "message": "SMS gönderme sırasında hata oluştu",
-                "message_en": "Error sending SMS"
-            }
-        )
+            detail=_SMS_ERROR_DETAIL
+        ) from None
 
 
 @router.post("/netgsm/whatsapp")
 async def send_whatsapp(
     request: WhatsAppRequest,
     background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:whatsapp"]))
+    current_user: Annotated[AuthUser, Depends(_DEP_WHATSAPP)]
 ):
     """
     Send WhatsApp message via NetGSM
     """
     try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
+        tenant_id = current_user.tenant_id
+        user_id = current_user.sub
         
         # Check WhatsApp quota
-        quota_result = await tenant_service.check_quota(tenant_id, "whatsapp", 1)
-        if not quota_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "quota_exceeded",
-                    "message": quota_result.get("message", "WhatsApp kotası aşıldı"),
-                    "message_en": quota_result.get("message_en", "WhatsApp quota exceeded")
-                }
-            )
+        await _check_quota(tenant_id, "whatsapp", 1, "WhatsApp kotası aşıldı", "WhatsApp quota exceeded")
         
         # Get NetGSM configuration
-        config_result = await tenant_service.get_integration_config(tenant_id, "netgsm")
-        
-        if not config_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "netgsm_not_configured",
-                    "message": "NetGSM entegrasyonu yapılandırılmamış",
-                    "message_en": "NetGSM integration not configured"
-                }
-            )
-        
-        config = config_result["config"]
+        config = await _get_netgsm_config(tenant_id)
         
         # Create connector and send WhatsApp message
-        connector_config = ConnectorConfig(
-            base_url="https://api.netgsm.com.tr",
-            username=config.get("username"),
-            password=config.get("password")
-        )
+        connector_config = _netgsm_connector_config(config)
         
         async with NetgsmConnector(connector_config) as connector:
             if request.message_type == "template":
@@ -443,25 +578,22 @@ async def send_whatsapp(
             user_id
         )
         
-        logger.info(
+        background_tasks.add_task(
+            logger.info,
             "WhatsApp sent",
-            tenant_id=str(tenant_id),
+            tenant_id=current_user.tenant_id_str,
             phone=request.phone,
             message_type=request.message_type,
             success=result.success,
-            user_id=str(user_id)
+            user_id=current_user.sub_str
         )
         
-        return {
-            "success": result.success,
-            "message": result.message_tr or ("WhatsApp mesajı gönderildi" if result.success else "WhatsApp mesajı gönderilemedi"),
-            "message_en": result.message_en or ("WhatsApp sent" if result.success else "WhatsApp failed"),
-            "whatsapp_result": {
-                "message_id": result.data.get("message_id") if result.data else None,
-                "status_code": result.status_code,
-                "error": result.error
-            }
-        }
+        return _json_response(WhatsAppResponse(
+            result.success,
+            result.message_tr or ("WhatsApp mesajı gönderildi" if result.success else "WhatsApp mesajı gönderilemedi"),
+            result.message_en or ("WhatsApp sent" if result.success else "WhatsApp failed"),
+            _message_result(result)
+        ))
         
     except HTTPException:
         raise
@@ -469,62 +601,33 @@ async def send_whatsapp(
         logger.error("Send WhatsApp error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "whatsapp_error",
-                "message": "WhatsApp gönderme sırasında hata oluştu",
-                "message_en": "Error sending WhatsApp"
-            }
-        )
+            detail=_WHATSAPP_ERROR_DETAIL
+        ) from None
 
 
 @router.post("/netgsm/bulk-sms")
 async def send_bulk_sms(
     request: BulkSMSRequest,
     background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:bulk_sms"]))
+    current_user: Annotated[AuthUser, Depends(_DEP_BULK_SMS)]
 ):
     """
     Send bulk SMS via NetGSM
     """
     try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
+        tenant_id = current_user.tenant_id
+        user_id = current_user.sub
         
         sms_count = len(request.phones)
         
         # Check SMS quota
-        quota_result = await tenant_service.check_quota(tenant_id, "sms", sms_count)
-        if not quota_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "quota_exceeded",
-                    "message": quota_result.get("message", "SMS kotası aşıldı"),
-                    "message_en": quota_result.get("message_en", "SMS quota exceeded")
-                }
-            )
+        await _check_quota(tenant_id, "sms", sms_count, "SMS kotası aşıldı", "SMS quota exceeded")
         
         # Get NetGSM configuration
-        config_result = await tenant_service.get_integration_config(tenant_id, "netgsm")
-        
-        if not config_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "netgsm_not_configured",
-                    "message": "NetGSM entegrasyonu yapılandırılmamış",
-                    "message_en": "NetGSM integration not configured"
-                }
-            )
-        
-        config = config_result["config"]
+        config = await _get_netgsm_config(tenant_id)
         
         # Create connector and send bulk SMS
-        connector_config = ConnectorConfig(
-            base_url="https://api.netgsm.com.tr",
-            username=config.get("username"),
-            password=config.get("password")
-        )
+        connector_config = _netgsm_connector_config(config)
         
         async with NetgsmConnector(connector_config) as connector:
             result = await connector.send_bulk_sms(
@@ -543,28 +646,29 @@ async def send_bulk_sms(
             user_id
         )
         
-        logger.info(
+        background_tasks.add_task(
+            logger.info,
             "Bulk SMS sent",
-            tenant_id=str(tenant_id),
+            tenant_id=current_user.tenant_id_str,
             total_count=sms_count,
             successful_count=successful_count,
             success=result.success,
-            user_id=str(user_id)
+            user_id=current_user.sub_str
         )
         
-        return {
-            "success": result.success,
-            "message": result.message_tr or f"{successful_count}/{sms_count} SMS gönderildi",
-            "message_en": result.message_en or f"{successful_count}/{sms_count} SMS sent",
-            "bulk_result": {
-                "total_count": sms_count,
-                "successful_count": successful_count,
-                "failed_count": sms_count - successful_count,
-                "status_code": result.status_code,
-                "error": result.error,
-                "details": result.data
-            }
-        }
+        return _json_response(BulkSmsResponse(
+            result.success,
+            result.message_tr or f"{successful_count}/{sms_count} SMS gönderildi",
+            result.message_en or f"{successful_count}/{sms_count} SMS sent",
+            BulkSmsResult(
+                sms_count,
+                successful_count,
+                sms_count - successful_count,
+                result.status_code,
+                result.error,
+                result.data
+            )
+        ))
         
     except HTTPException:
         raise
@@ -572,48 +676,28 @@ async def send_bulk_sms(
         logger.error("Send bulk SMS error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "bulk_sms_error",
-                "message": "Toplu SMS gönderme sırasında hata oluştu",
-                "message_en": "Error sending bulk SMS"
-            }
-        )
+            detail=_BULK_SMS_ERROR_DETAIL
+        ) from None
 
 
 @router.get("/netgsm/reports")
 async def get_sms_reports(
-    current_user: Dict[str, Any] = Depends(require_permissions(["integration:reports"])),
+    current_user: Annotated[AuthUser, Depends(_DEP_REPORTS)],
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    message_type: Optional[str] = Query(None, regex="^(sms|whatsapp)$")
+    message_type: Optional[str] = Query(None, pattern="^(sms|whatsapp)$")
 ):
     """
     Get SMS/WhatsApp delivery reports from NetGSM
     """
     try:
-        tenant_id = current_user["tenant_id"]
+        tenant_id = current_user.tenant_id
         
         # Get NetGSM configuration
-        config_result = await tenant_service.get_integration_config(tenant_id, "netgsm")
-        
-        if not config_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "netgsm_not_configured",
-                    "message": "NetGSM entegrasyonu yapılandırılmamış",
-                    "message_en": "NetGSM integration not configured"
-                }
-            )
-        
-        config = config_result["config"]
+        config = await _get_netgsm_config(tenant_id)
         
         # Create connector and get reports
-        connector_config = ConnectorConfig(
-            base_url="https://api.netgsm.com.tr",
-            username=config.get("username"),
-            password=config.get("password")
-        )
+        connector_config = _netgsm_connector_config(config)
         
         async with NetgsmConnector(connector_config) as connector:
             result = await connector.get_reports(
@@ -645,12 +729,93 @@ async def get_sms_reports(
         logger.error("Get SMS reports error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "reports_error",
-                "message": "Rapor alma sırasında hata oluştu",
-                "message_en": "Error getting reports"
-            }
+            detail=_REPORTS_ERROR_DETAIL
+        ) from None
+
+
+async def _stream_report_lines(
+    stack: AsyncExitStack,
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    first_page: List[Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Encode NetGSM report pages as NDJSON, flushing in ~64 KB chunks
+    
+    The response status is already sent, so a ConnectorError on a later page
+    ends the stream with a terminal ``{"error": ...}`` line.
+    """
+    buffer = bytearray()
+    async with stack:
+        page = first_page
+        try:
+            while True:
+                for record in page:
+                    buffer += orjson.dumps(record)
+                    buffer += b"\n"
+                    if len(buffer) >= REPORT_STREAM_FLUSH_BYTES:
+                        yield bytes(buffer)
+                        buffer.clear()
+                page = await anext(pages, None)
+                if page is None:
+                    break
+        except ConnectorError as e:
+            logger.error("Stream SMS reports error", error=e.message, error_code=e.error_code)
+            buffer += orjson.dumps({
+                "error": "reports_stream_failed",
+                "error_code": e.error_code,
+                "message": "Rapor akışı yarıda kesildi",
+                "message_en": "Report stream interrupted"
+            })
+            buffer += b"\n"
+        
+        if buffer:
+            yield bytes(buffer)
+
+
+@router.get("/netgsm/reports/stream")
+async def stream_sms_reports(
+    current_user: Annotated[AuthUser, Depends(_DEP_REPORTS)],
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    message_type: Optional[str] = Query(None, pattern="^(sms|whatsapp)$")
+):
+    """
+    Stream SMS/WhatsApp delivery reports from NetGSM as NDJSON (one record per line)
+    
+    The first page is fetched before the response starts, so connection and
+    authentication failures are reported as 502 instead of an empty stream.
+    """
+    tenant_id = current_user.tenant_id
+    
+    # Get NetGSM configuration
+    config = await _get_netgsm_config(tenant_id)
+    connector_config = _netgsm_connector_config(config)
+    
+    stack = AsyncExitStack()
+    try:
+        connector = await stack.enter_async_context(NetgsmConnector(connector_config))
+        pages = connector.iter_reports(
+            start_date=start_date,
+            end_date=end_date,
+            message_type=message_type
         )
+        stack.push_async_callback(pages.aclose)
+        first_page = await anext(pages, [])
+    except ConnectorError as e:
+        await stack.aclose()
+        logger.error("Stream SMS reports error", error=e.message, error_code=e.error_code)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=_REPORTS_UPSTREAM_ERROR_DETAIL
+        ) from None
+    except BaseException:
+        await stack.aclose()
+        raise
+    
+    return StreamingResponse(
+        _stream_report_lines(stack, pages, first_page),
+        media_type="application/x-ndjson"
+    )
 
 
 @router.get("/status")
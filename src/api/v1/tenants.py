@@ -2,25 +2,112 @@
 Tenant management endpoints for Turkish Business Integration Platform
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Annotated, List, Optional, Tuple
 from datetime import datetime
+import base64
+import hashlib
+import logging
+import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, validator
-import structlog
+import redis.asyncio as redis
+import orjson
 
-from src.core.security import get_current_active_user, require_permissions
+from src.api.errors import error_detail, handle_endpoint_errors
+from src.config import settings
+from src.core.security import AuthUser, get_current_active_user, require_permissions
 from src.services.tenant_service import tenant_service
 from src.services.kvkk_service import kvkk_service, DataExportRequest, AnonymizationRequest
 
-logger = structlog.get_logger(__name__)
-router = APIRouter()
+# Plain stdlib logger for request logs; unexpected errors are logged and
+# mapped to endpoint error codes by handle_endpoint_errors
+_log = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Permission dependencies, resolved once at import
+_REQ_TENANT_UPDATE = require_permissions(["tenant:update"])
+_REQ_USER_READ = require_permissions(["user:read"])
+_REQ_USER_CREATE = require_permissions(["user:create"])
+_REQ_USER_UPDATE = require_permissions(["user:update"])
+_REQ_USER_DELETE = require_permissions(["user:delete"])
+_REQ_TENANT_BILLING = require_permissions(["tenant:billing"])
+_REQ_KVKK_ANONYMIZE = require_permissions(["kvkk:anonymize"])
+
+# Static error details
+_TENANT_NOT_FOUND_DETAIL = error_detail(
+    "tenant_not_found",
+    "Şirket bilgileri bulunamadı",
+    "Tenant not found"
+)
+_NO_DATA_DETAIL = error_detail(
+    "no_data",
+    "Güncellenecek veri yok",
+    "No data to update"
+)
+_INVALID_CURSOR_DETAIL = error_detail(
+    "invalid_cursor",
+    "Geçersiz sayfalama imleci",
+    "Invalid pagination cursor"
+)
+_CANNOT_DELETE_SELF_DETAIL = error_detail(
+    "cannot_delete_self",
+    "Kendi hesabınızı silemezsiniz",
+    "Cannot delete your own account"
+)
+_EXPORT_OWN_DATA_ONLY_DETAIL = error_detail(
+    "insufficient_permissions",
+    "Sadece kendi verilerinizi dışa aktarabilirsiniz",
+    "You can only export your own data"
+)
+_DELETION_NOT_CONFIRMED_DETAIL = error_detail(
+    "anonymization_failed",
+    "Silme onayı gerekli",
+    "Deletion confirmation required"
+)
+_JOB_NOT_FOUND_DETAIL = error_detail(
+    "job_not_found",
+    "Anonimleştirme işi bulunamadı",
+    "Anonymization job not found"
+)
+
+# Redis client for cached user listing totals
+redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+
+# Only totals above this are worth caching; small tenants count cheaply
+USER_COUNT_CACHE_THRESHOLD = 1000
+USER_COUNT_CACHE_TTL = 60
+
+
+def _user_count_cache_key(tenant_id: str) -> str:
+    """Build the hash key holding a tenant's cached users totals"""
+    return f"users:count:{tenant_id}"
+
+
+def _user_count_field(search: Optional[str]) -> str:
+    """Build the hash field for a search term within the tenant's totals"""
+    return hashlib.md5((search or "").encode()).hexdigest()
+
+
+async def _invalidate_user_counts(tenant_id: str) -> None:
+    """Drop every cached users total for the tenant"""
+    try:
+        await redis_client.delete(_user_count_cache_key(tenant_id))
+    except redis.RedisError as e:
+        _log.warning("Users count cache invalidation failed: %s", e)
+
+
+# Shared field patterns, compiled once into the pydantic-core validators
+_PHONE_PATTERN = r'^\+90[0-9]{10}$'
+_ROLE_PATTERN = "^(admin|user|viewer)$"
 
 
 class TenantUpdateRequest(BaseModel):
     """Tenant update request"""
     company_name: Optional[str] = Field(None, min_length=2, max_length=100)
-    phone: Optional[str] = Field(None, regex=r'^\+90[0-9]{10}$')
+    phone: Optional[str] = Field(None, pattern=_PHONE_PATTERN)
     address: Optional[str] = Field(None, max_length=500)
     website: Optional[str] = Field(None, max_length=200)
     industry: Optional[str] = Field(None, max_length=100)
@@ -31,8 +118,8 @@ class UserCreateRequest(BaseModel):
     email: str = Field(..., max_length=255)
     first_name: str = Field(..., min_length=2, max_length=50)
     last_name: str = Field(..., min_length=2, max_length=50)
-    phone: Optional[str] = Field(None, regex=r'^\+90[0-9]{10}$')
-    role: str = Field(default="user", regex="^(admin|user|viewer)$")
+    phone: Optional[str] = Field(None, pattern=_PHONE_PATTERN)
+    role: str = Field(default="user", pattern=_ROLE_PATTERN)
     permissions: List[str] = Field(default_factory=list)
 
 
@@ -40,625 +127,693 @@ class UserUpdateRequest(BaseModel):
     """Update user request"""
     first_name: Optional[str] = Field(None, min_length=2, max_length=50)
     last_name: Optional[str] = Field(None, min_length=2, max_length=50)
-    phone: Optional[str] = Field(None, regex=r'^\+90[0-9]{10}$')
-    role: Optional[str] = Field(None, regex="^(admin|user|viewer)$")
+    phone: Optional[str] = Field(None, pattern=_PHONE_PATTERN)
+    role: Optional[str] = Field(None, pattern=_ROLE_PATTERN)
     permissions: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
 
 class PlanUpgradeRequest(BaseModel):
     """Plan upgrade request"""
-    plan: str = Field(..., regex="^(starter|professional|enterprise)$")
-    billing_period: str = Field(default="monthly", regex="^(monthly|yearly)$")
+    plan: str = Field(..., pattern="^(starter|professional|enterprise)$")
+    billing_period: str = Field(default="monthly", pattern="^(monthly|yearly)$")
 
 
 @router.get("/info")
-async def get_tenant_info(current_user: Dict[str, Any] = Depends(get_current_active_user)):
+@handle_endpoint_errors(
+    "Get tenant info error",
+    "get_tenant_error",
+    "Şirket bilgileri alınırken hata oluştu",
+    "Error getting tenant information"
+)
+async def get_tenant_info(
+    http_request: Request,
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
+):
     """
     Get current tenant information
+    
+    Responds with an ETag derived from the tenant's ``updated_at`` and answers
+    a matching ``If-None-Match`` with 304 Not Modified.
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        result = await tenant_service.get_tenant_by_id(tenant_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "tenant_not_found",
-                    "message": "Şirket bilgileri bulunamadı",
-                    "message_en": "Tenant not found"
-                }
-            )
-        
-        return {
-            "success": True,
-            "tenant": result["tenant"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get tenant info error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    result = await tenant_service.get_tenant_by_id(tenant_id)
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "get_tenant_error",
-                "message": "Şirket bilgileri alınırken hata oluştu",
-                "message_en": "Error getting tenant information"
-            }
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_TENANT_NOT_FOUND_DETAIL
         )
+    
+    tenant = result["tenant"]
+    # Cache hits carry updated_at as an ISO string, DB reads as a datetime
+    updated_at = tenant.get("updated_at")
+    if isinstance(updated_at, datetime):
+        updated_at = updated_at.isoformat()
+    etag = '"%s"' % hashlib.md5(f"{tenant_id}:{updated_at}".encode()).hexdigest()
+    
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    return ORJSONResponse(
+        {
+            "success": True,
+            "tenant": tenant
+        },
+        headers={"ETag": etag}
+    )
 
 
 @router.put("/info")
+@handle_endpoint_errors(
+    "Update tenant error",
+    "update_tenant_error",
+    "Güncelleme sırasında hata oluştu",
+    "Error updating tenant information"
+)
 async def update_tenant_info(
     request: TenantUpdateRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["tenant:update"]))
+    current_user: Annotated[AuthUser, Depends(_REQ_TENANT_UPDATE)]
 ):
     """
     Update tenant information (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        # Prepare update data
-        update_data = {}
-        for field, value in request.dict(exclude_unset=True).items():
-            if value is not None:
-                update_data[field] = value
-        
-        if not update_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "no_data",
-                    "message": "Güncellenecek veri yok",
-                    "message_en": "No data to update"
-                }
-            )
-        
-        result = await tenant_service.update_tenant(
-            tenant_id=tenant_id,
-            update_data=update_data,
-            updated_by=user_id
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "update_failed",
-                    "message": result.get("message", "Güncelleme başarısız"),
-                    "message_en": result.get("message_en", "Update failed")
-                }
-            )
-        
-        logger.info(
-            "Tenant updated",
-            tenant_id=str(tenant_id),
-            updated_by=str(user_id),
-            fields=list(update_data.keys())
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    # Prepare update data
+    update_data = request.model_dump(exclude_unset=True, exclude_none=True)
+    
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_NO_DATA_DETAIL
         )
-        
-        return {
-            "success": True,
-            "message": "Şirket bilgileri güncellendi",
-            "message_en": "Tenant information updated",
-            "tenant": result["tenant"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Update tenant error", error=str(e))
+    
+    result = await tenant_service.update_tenant(
+        tenant_id=tenant_id,
+        update_data=update_data,
+        updated_by=user_id
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "update_tenant_error",
-                "message": "Güncelleme sırasında hata oluştu",
-                "message_en": "Error updating tenant information"
+                "error": "update_failed",
+                "message": result.get("message", "Güncelleme başarısız"),
+                "message_en": result.get("message_en", "Update failed")
             }
         )
+    
+    _log.info(
+        "Tenant updated",
+        extra={
+            "tenant_id": str(tenant_id),
+            "updated_by": str(user_id),
+            "fields": list(update_data.keys())
+        }
+    )
+    
+    return {
+        "success": True,
+        "message": "Şirket bilgileri güncellendi",
+        "message_en": "Tenant information updated",
+        "tenant": result["tenant"]
+    }
+
+
+def _encode_users_cursor(created_at: str, user_id: str) -> str:
+    """Encode the last seen (created_at, id) pair as an opaque cursor"""
+    return base64.urlsafe_b64encode(f"{created_at}|{user_id}".encode()).decode()
+
+
+def _decode_users_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a users listing cursor
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        created_at, user_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), user_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_INVALID_CURSOR_DETAIL
+        ) from None
 
 
 @router.get("/users")
+@handle_endpoint_errors(
+    "Get tenant users error",
+    "get_users_error",
+    "Kullanıcı listesi alınırken hata oluştu",
+    "Error getting user list"
+)
 async def get_tenant_users(
-    current_user: Dict[str, Any] = Depends(require_permissions(["user:read"])),
-    page: int = Query(1, ge=1),
+    current_user: Annotated[AuthUser, Depends(_REQ_USER_READ)],
+    cursor: Optional[str] = Query(None, description="Opaque cursor from previous page's next_cursor"),
+    page: int = Query(1, ge=1, description="Legacy offset page, ignored when cursor is given"),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None, max_length=100)
 ):
     """
-    Get tenant users with pagination and search
+    Get tenant users with keyset pagination and search
+    
+    Users are ordered by (created_at, id) descending. Pass the returned
+    ``next_cursor`` to fetch the following page.
     """
+    tenant_id = current_user.tenant_id_str
+    count_key = _user_count_cache_key(tenant_id)
+    count_field = _user_count_field(search)
     try:
-        tenant_id = current_user["tenant_id"]
-        
-        result = await tenant_service.get_tenant_users(
-            tenant_id=tenant_id,
-            page=page,
-            size=size,
-            search=search
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "get_users_error",
-                    "message": result.get("message", "Kullanıcılar alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get users")
-                }
-            )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get tenant users error", error=str(e))
+        cached_total = await redis_client.hget(count_key, count_field)
+    except redis.RedisError as e:
+        _log.warning("Users count cache read failed: %s", e)
+        cached_total = None
+    
+    result = await tenant_service.get_tenant_users(
+        tenant_id=tenant_id,
+        cursor=_decode_users_cursor(cursor) if cursor else None,
+        page=None if cursor else page,
+        size=size,
+        search=search,
+        include_total=cached_total is None
+    )
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "get_users_error",
-                "message": "Kullanıcı listesi alınırken hata oluştu",
-                "message_en": "Error getting user list"
+                "message": result.get("message", "Kullanıcılar alınamadı"),
+                "message_en": result.get("message_en", "Failed to get users")
             }
         )
+    
+    if cached_total is not None:
+        result["total"] = int(cached_total)
+    elif result.get("total", 0) > USER_COUNT_CACHE_THRESHOLD:
+        # The TTL applies to the whole hash, counted from its first total
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(count_key, count_field, result["total"])
+                pipe.expire(count_key, USER_COUNT_CACHE_TTL, nx=True)
+                await pipe.execute()
+        except redis.RedisError as e:
+            _log.warning("Users count cache write failed: %s", e)
+    
+    users = result.get("users", [])
+    result["next_cursor"] = (
+        _encode_users_cursor(str(users[-1]["created_at"]), str(users[-1]["id"]))
+        if len(users) == size else None
+    )
+    
+    return result
 
 
 @router.post("/users")
+@handle_endpoint_errors(
+    "Create user error",
+    "create_user_error",
+    "Kullanıcı oluşturma sırasında hata oluştu",
+    "Error creating user"
+)
 async def create_user(
     request: UserCreateRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["user:create"]))
+    current_user: Annotated[AuthUser, Depends(_REQ_USER_CREATE)]
 ):
     """
     Create new user (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        created_by = current_user["sub"]
-        
-        result = await tenant_service.create_user(
-            tenant_id=tenant_id,
-            email=request.email,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            phone=request.phone,
-            role=request.role,
-            permissions=request.permissions,
-            created_by=created_by
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "user_creation_failed",
-                    "message": result.get("message", "Kullanıcı oluşturulamadı"),
-                    "message_en": result.get("message_en", "User creation failed")
-                }
-            )
-        
-        logger.info(
-            "User created",
-            tenant_id=str(tenant_id),
-            user_id=str(result["user_id"]),
-            email=request.email,
-            created_by=str(created_by)
-        )
-        
-        return {
-            "success": True,
-            "message": "Kullanıcı başarıyla oluşturuldu",
-            "message_en": "User created successfully",
-            "user_id": str(result["user_id"]),
-            "user": result["user"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Create user error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    created_by = current_user.sub_str
+    
+    result = await tenant_service.create_user(
+        tenant_id=tenant_id,
+        email=request.email,
+        first_name=request.first_name,
+        last_name=request.last_name,
+        phone=request.phone,
+        role=request.role,
+        permissions=request.permissions,
+        created_by=created_by
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "create_user_error",
-                "message": "Kullanıcı oluşturma sırasında hata oluştu",
-                "message_en": "Error creating user"
+                "error": "user_creation_failed",
+                "message": result.get("message", "Kullanıcı oluşturulamadı"),
+                "message_en": result.get("message_en", "User creation failed")
             }
         )
+    
+    await _invalidate_user_counts(tenant_id)
+    
+    _log.info(
+        "User created",
+        extra={
+            "tenant_id": str(tenant_id),
+            "user_id": str(result["user_id"]),
+            "email": request.email,
+            "created_by": str(created_by)
+        }
+    )
+    
+    return {
+        "success": True,
+        "message": "Kullanıcı başarıyla oluşturuldu",
+        "message_en": "User created successfully",
+        "user_id": str(result["user_id"]),
+        "user": result["user"]
+    }
 
 
 @router.put("/users/{user_id}")
+@handle_endpoint_errors(
+    "Update user error",
+    "update_user_error",
+    "Kullanıcı güncelleme sırasında hata oluştu",
+    "Error updating user"
+)
 async def update_user(
-    user_id: str,
+    user_id: uuid.UUID,
     request: UserUpdateRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["user:update"]))
+    current_user: Annotated[AuthUser, Depends(_REQ_USER_UPDATE)]
 ):
     """
     Update user information (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        updated_by = current_user["sub"]
-        
-        # Prepare update data
-        update_data = {}
-        for field, value in request.dict(exclude_unset=True).items():
-            if value is not None:
-                update_data[field] = value
-        
-        if not update_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "no_data",
-                    "message": "Güncellenecek veri yok",
-                    "message_en": "No data to update"
-                }
-            )
-        
-        result = await tenant_service.update_user(
-            tenant_id=tenant_id,
-            user_id=user_id,
-            update_data=update_data,
-            updated_by=updated_by
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "update_failed",
-                    "message": result.get("message", "Güncelleme başarısız"),
-                    "message_en": result.get("message_en", "Update failed")
-                }
-            )
-        
-        logger.info(
-            "User updated",
-            tenant_id=str(tenant_id),
-            user_id=user_id,
-            updated_by=str(updated_by),
-            fields=list(update_data.keys())
+    tenant_id = current_user.tenant_id_str
+    updated_by = current_user.sub_str
+    
+    # Prepare update data
+    update_data = request.model_dump(exclude_unset=True, exclude_none=True)
+    
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_NO_DATA_DETAIL
         )
-        
-        return {
-            "success": True,
-            "message": "Kullanıcı bilgileri güncellendi",
-            "message_en": "User information updated",
-            "user": result["user"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Update user error", error=str(e))
+    
+    result = await tenant_service.update_user(
+        tenant_id=tenant_id,
+        user_id=user_id,
+        update_data=update_data,
+        updated_by=updated_by
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "update_user_error",
-                "message": "Kullanıcı güncelleme sırasında hata oluştu",
-                "message_en": "Error updating user"
+                "error": "update_failed",
+                "message": result.get("message", "Güncelleme başarısız"),
+                "message_en": result.get("message_en", "Update failed")
             }
         )
+    
+    _log.info(
+        "User updated",
+        extra={
+            "tenant_id": str(tenant_id),
+            "user_id": str(user_id),
+            "updated_by": str(updated_by),
+            "fields": list(update_data.keys())
+        }
+    )
+    
+    return {
+        "success": True,
+        "message": "Kullanıcı bilgileri güncellendi",
+        "message_en": "User information updated",
+        "user": result["user"]
+    }
 
 
 @router.delete("/users/{user_id}")
+@handle_endpoint_errors(
+    "Delete user error",
+    "delete_user_error",
+    "Kullanıcı silme sırasında hata oluştu",
+    "Error deleting user"
+)
 async def delete_user(
-    user_id: str,
-    current_user: Dict[str, Any] = Depends(require_permissions(["user:delete"]))
+    user_id: uuid.UUID,
+    current_user: Annotated[AuthUser, Depends(_REQ_USER_DELETE)]
 ):
     """
     Delete user (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        deleted_by = current_user["sub"]
-        
-        # Prevent self-deletion
-        if user_id == deleted_by:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "cannot_delete_self",
-                    "message": "Kendi hesabınızı silemezsiniz",
-                    "message_en": "Cannot delete your own account"
-                }
-            )
-        
-        result = await tenant_service.delete_user(
-            tenant_id=tenant_id,
-            user_id=user_id,
-            deleted_by=deleted_by
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "delete_failed",
-                    "message": result.get("message", "Silme işlemi başarısız"),
-                    "message_en": result.get("message_en", "Delete failed")
-                }
-            )
-        
-        logger.info(
-            "User deleted",
-            tenant_id=str(tenant_id),
-            user_id=user_id,
-            deleted_by=str(deleted_by)
+    tenant_id = current_user.tenant_id_str
+    deleted_by = current_user.sub_str
+    
+    # Prevent self-deletion
+    if user_id == current_user.sub:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_CANNOT_DELETE_SELF_DETAIL
         )
-        
-        return {
-            "success": True,
-            "message": "Kullanıcı başarıyla silindi",
-            "message_en": "User deleted successfully"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Delete user error", error=str(e))
+    
+    result = await tenant_service.delete_user(
+        tenant_id=tenant_id,
+        user_id=user_id,
+        deleted_by=deleted_by
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "delete_user_error",
-                "message": "Kullanıcı silme sırasında hata oluştu",
-                "message_en": "Error deleting user"
+                "error": "delete_failed",
+                "message": result.get("message", "Silme işlemi başarısız"),
+                "message_en": result.get("message_en", "Delete failed")
             }
         )
+    
+    await _invalidate_user_counts(tenant_id)
+    
+    _log.info(
+        "User deleted",
+        extra={
+            "tenant_id": str(tenant_id),
+            "user_id": str(user_id),
+            "deleted_by": str(deleted_by)
+        }
+    )
+    
+    return {
+        "success": True,
+        "message": "Kullanıcı başarıyla silindi",
+        "message_en": "User deleted successfully"
+    }
 
 
 @router.get("/subscription")
+@handle_endpoint_errors(
+    "Get subscription info error",
+    "subscription_error",
+    "Abonelik bilgileri alınırken hata oluştu",
+    "Error getting subscription information"
+)
 async def get_subscription_info(
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Get tenant subscription information
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        result = await tenant_service.get_subscription_info(tenant_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "subscription_error",
-                    "message": result.get("message", "Abonelik bilgileri alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get subscription info")
-                }
-            )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get subscription info error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    result = await tenant_service.get_subscription_info(tenant_id)
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "subscription_error",
-                "message": "Abonelik bilgileri alınırken hata oluştu",
-                "message_en": "Error getting subscription information"
+                "message": result.get("message", "Abonelik bilgileri alınamadı"),
+                "message_en": result.get("message_en", "Failed to get subscription info")
             }
         )
+    
+    return result
 
 
 @router.post("/subscription/upgrade")
+@handle_endpoint_errors(
+    "Upgrade subscription error",
+    "upgrade_error",
+    "Plan yükseltme sırasında hata oluştu",
+    "Error upgrading subscription"
+)
 async def upgrade_subscription(
     request: PlanUpgradeRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["tenant:billing"]))
+    current_user: Annotated[AuthUser, Depends(_REQ_TENANT_BILLING)]
 ):
     """
     Upgrade tenant subscription plan (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        result = await tenant_service.upgrade_tenant_plan(
-            tenant_id=tenant_id,
-            new_plan=request.plan,
-            billing_period=request.billing_period,
-            upgraded_by=user_id
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "upgrade_failed",
-                    "message": result.get("message", "Plan yükseltme başarısız"),
-                    "message_en": result.get("message_en", "Plan upgrade failed")
-                }
-            )
-        
-        logger.info(
-            "Subscription upgraded",
-            tenant_id=str(tenant_id),
-            new_plan=request.plan,
-            billing_period=request.billing_period,
-            upgraded_by=str(user_id)
-        )
-        
-        return {
-            "success": True,
-            "message": f"Plan {request.plan} seviyesine yükseltildi",
-            "message_en": f"Plan upgraded to {request.plan}",
-            "subscription": result["subscription"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Upgrade subscription error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    result = await tenant_service.upgrade_tenant_plan(
+        tenant_id=tenant_id,
+        new_plan=request.plan,
+        billing_period=request.billing_period,
+        upgraded_by=user_id
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "upgrade_error",
-                "message": "Plan yükseltme sırasında hata oluştu",
-                "message_en": "Error upgrading subscription"
+                "error": "upgrade_failed",
+                "message": result.get("message", "Plan yükseltme başarısız"),
+                "message_en": result.get("message_en", "Plan upgrade failed")
             }
         )
+    
+    _log.info(
+        "Subscription upgraded",
+        extra={
+            "tenant_id": str(tenant_id),
+            "new_plan": request.plan,
+            "billing_period": request.billing_period,
+            "upgraded_by": str(user_id)
+        }
+    )
+    
+    return {
+        "success": True,
+        "message": f"Plan {request.plan} seviyesine yükseltildi",
+        "message_en": f"Plan upgraded to {request.plan}",
+        "subscription": result["subscription"]
+    }
 
 
 @router.get("/usage")
+@handle_endpoint_errors(
+    "Get usage stats error",
+    "usage_stats_error",
+    "Kullanım istatistikleri alınırken hata oluştu",
+    "Error getting usage statistics"
+)
 async def get_usage_stats(
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Get tenant usage statistics
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        result = await tenant_service.get_usage_stats(tenant_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "usage_stats_error",
-                    "message": result.get("message", "Kullanım istatistikleri alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get usage statistics")
-                }
-            )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get usage stats error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    result = await tenant_service.get_usage_stats(tenant_id)
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "usage_stats_error",
-                "message": "Kullanım istatistikleri alınırken hata oluştu",
-                "message_en": "Error getting usage statistics"
+                "message": result.get("message", "Kullanım istatistikleri alınamadı"),
+                "message_en": result.get("message_en", "Failed to get usage statistics")
             }
         )
+    
+    return result
 
 
 @router.post("/kvkk/export-data")
+@handle_endpoint_errors(
+    "Export user data error",
+    "export_error",
+    "Veri dışa aktarma sırasında hata oluştu",
+    "Error exporting user data"
+)
 async def export_user_data(
     request: DataExportRequest,
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Export user data for KVKK compliance (data portability right)
+    
+    JSON exports stream the data itself; CSV/XML exports return archive metadata.
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        
-        # Users can only export their own data unless they have admin rights
-        if (str(request.data_subject_id) != current_user["sub"] and 
-            "kvkk:export_all" not in current_user.get("permissions", [])):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "error": "insufficient_permissions",
-                    "message": "Sadece kendi verilerinizi dışa aktarabilirsiniz",
-                    "message_en": "You can only export your own data"
-                }
-            )
-        
-        result = await kvkk_service.export_user_data(tenant_id, request)
-        
-        if not result["success"]:
+    tenant_id = current_user.tenant_id_str
+    
+    # Users can only export their own data unless they have admin rights
+    if (str(request.data_subject_id) != current_user.sub_str and 
+        "kvkk:export_all" not in current_user.permissions):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=_EXPORT_OWN_DATA_ONLY_DETAIL
+        )
+    
+    # JSON exports are streamed straight to the client instead of being
+    # assembled in memory and archived
+    if request.export_format == "json":
+        try:
+            chunks = await kvkk_service.stream_user_data(tenant_id, request)
+        except Exception as e:
+            _log.error("KVKK data export error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
                     "error": "export_failed",
-                    "message": result.get("message", "Veri dışa aktarımı başarısız"),
-                    "message_en": result.get("message_en", "Data export failed")
+                    "message": "Veri dışa aktarımı başarısız",
+                    "message_en": "Data export failed"
                 }
             )
         
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Export user data error", error=str(e))
+        return StreamingResponse(chunks, media_type="application/json")
+    
+    result = await kvkk_service.export_user_data(tenant_id, request)
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
-                "error": "export_error",
-                "message": "Veri dışa aktarma sırasında hata oluştu",
-                "message_en": "Error exporting user data"
+                "error": "export_failed",
+                "message": result.get("message", "Veri dışa aktarımı başarısız"),
+                "message_en": result.get("message_en", "Data export failed")
+            }
+        )
+    
+    return result
+
+
+ANONYMIZATION_JOB_KEY = "kvkk:anonymization:{job_id}"
+ANONYMIZATION_JOB_TTL = 7 * 24 * 3600  # Keep job results for a week
+
+
+async def _run_anonymization_job(
+    job_id: str,
+    tenant_id: str,
+    request: AnonymizationRequest,
+    performed_by: str
+) -> None:
+    """Run a queued anonymization and record its outcome under the job key"""
+    job_key = ANONYMIZATION_JOB_KEY.format(job_id=job_id)
+    await redis_client.hset(job_key, "status", "running")
+    
+    try:
+        result = await kvkk_service.anonymize_user_data(tenant_id, request, performed_by)
+    except Exception as e:
+        _log.error("Anonymization job failed", extra={"job_id": job_id, "error": str(e)})
+        result = {
+            "success": False,
+            "message": "Veri anonimleştirme sırasında hata oluştu",
+            "message_en": "Error anonymizing user data"
+        }
+    
+    await redis_client.hset(job_key, mapping={
+        "status": "completed" if result["success"] else "failed",
+        "result": orjson.dumps(result, default=str).decode()
+    })
+    
+    if result["success"]:
+        _log.info(
+            "User data anonymized",
+            extra={
+                "job_id": job_id,
+                "tenant_id": str(tenant_id),
+                "data_subject_id": str(request.data_subject_id),
+                "performed_by": str(performed_by)
             }
         )
 
 
-@router.post("/kvkk/anonymize-data")
+@router.post("/kvkk/anonymize-data", status_code=status.HTTP_202_ACCEPTED)
+@handle_endpoint_errors(
+    "Anonymize user data error",
+    "anonymization_error",
+    "Veri anonimleştirme sırasında hata oluştu",
+    "Error anonymizing user data"
+)
 async def anonymize_user_data(
     request: AnonymizationRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["kvkk:anonymize"]))
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[AuthUser, Depends(_REQ_KVKK_ANONYMIZE)]
 ):
     """
-    Anonymize user data for KVKK compliance (right to erasure) - Admin only
+    Queue anonymization of user data for KVKK compliance (right to erasure) - Admin only
+    
+    Returns a job id; poll ``/kvkk/anonymization-status/{job_id}`` for the result.
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        performed_by = current_user["sub"]
-        
-        result = await kvkk_service.anonymize_user_data(
-            tenant_id, 
-            request,
-            performed_by
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "anonymization_failed",
-                    "message": result.get("message", "Veri anonimleştirme başarısız"),
-                    "message_en": result.get("message_en", "Data anonymization failed")
-                }
-            )
-        
-        logger.info(
-            "User data anonymized",
-            tenant_id=str(tenant_id),
-            data_subject_id=str(request.data_subject_id),
-            performed_by=str(performed_by)
+    if not request.confirm_deletion:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_DELETION_NOT_CONFIRMED_DETAIL
         )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Anonymize user data error", error=str(e))
+    
+    tenant_id = current_user.tenant_id_str
+    performed_by = current_user.sub_str
+    job_id = str(uuid.uuid4())
+    job_key = ANONYMIZATION_JOB_KEY.format(job_id=job_id)
+    
+    await redis_client.hset(job_key, mapping={"status": "queued", "tenant_id": str(tenant_id)})
+    await redis_client.expire(job_key, ANONYMIZATION_JOB_TTL)
+    
+    background_tasks.add_task(
+        _run_anonymization_job,
+        job_id,
+        tenant_id,
+        request,
+        performed_by
+    )
+    
+    return {
+        "success": True,
+        "message": "Veri anonimleştirme kuyruğa alındı",
+        "message_en": "Data anonymization queued",
+        "job_id": job_id,
+        "status": "queued"
+    }
+
+
+@router.get("/kvkk/anonymization-status/{job_id}")
+async def get_anonymization_status(
+    job_id: str,
+    current_user: Annotated[AuthUser, Depends(_REQ_KVKK_ANONYMIZE)]
+):
+    """
+    Get status of a queued anonymization job
+    """
+    job = await redis_client.hgetall(ANONYMIZATION_JOB_KEY.format(job_id=job_id))
+    
+    # Jobs of other tenants are reported as missing
+    if not job or job.get("tenant_id") != current_user.tenant_id_str:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "anonymization_error",
-                "message": "Veri anonimleştirme sırasında hata oluştu",
-                "message_en": "Error anonymizing user data"
-            }
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_JOB_NOT_FOUND_DETAIL
         )
+    
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": job["status"],
+        "result": orjson.loads(job["result"]) if "result" in job else None
+    }
+
+
+# Constant /status payload, serialized once at import
+_STATUS_BYTES = orjson.dumps({
+    "status": "active",
+    "service": "Tenant Management API",
+    "version": "1.0.0",
+    "features": [
+        "Tenant Information Management",
+        "User Management",
+        "Subscription Management",
+        "Usage Statistics",
+        "KVKK Compliance",
+        "Data Export & Anonymization"
+    ]
+})
 
 
 @router.get("/status")
 async def tenant_status():
     """Get tenant service status"""
-    return {
-        "status": "active",
-        "service": "Tenant Management API",
-        "version": "1.0.0",
-        "features": [
-            "Tenant Information Management",
-            "User Management",
-            "Subscription Management",
-            "Usage Statistics",
-            "KVKK Compliance",
-            "Data Export & Anonymization"
-        ]
-    }
\ No newline at end of file
+    return Response(content=_STATUS_BYTES, media_type="application/json")
@@ -2,27 +2,261 @@
 Webhook endpoints for Turkish Business Integration Platform
 """
 
+import binascii
 import hmac
 import hashlib
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import time
+from typing import Annotated, Dict, Any, FrozenSet, List, Optional, Tuple
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
-from pydantic import BaseModel, Field, HttpUrl
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+import orjson
+import redis.asyncio as redis
 import structlog
 
-from src.core.security import get_current_active_user, require_permissions
+from src.api.errors import handle_endpoint_errors
+from src.config import settings
+from src.core.security import AuthUser, get_current_active_user, require_permissions
 from src.services.tenant_service import tenant_service
+from src.services.webhook_dispatcher import webhook_dispatcher, WebhookQueueFullError
 
 logger = structlog.get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Redis client for cached webhook lookups (raw orjson bytes)
+redis_client = redis.from_url(settings.redis_url)
+
+WEBHOOK_CACHE_KEY = "wh:{tenant_id}:{webhook_id}"
+WEBHOOK_CACHE_TTL = 300
+
+# Webhook fields never cached or returned by lookups
+WEBHOOK_CREDENTIAL_FIELDS = frozenset(("secret",))
+
+# Webhook event catalogue, built once at import
+AVAILABLE_EVENTS: Tuple[Dict[str, str], ...] = (
+    {
+        "event": "user.created",
+        "description": "Yeni kullanıcı oluşturulduğunda",
+        "description_en": "When a new user is created"
+    },
+    {
+        "event": "user.updated",
+        "description": "Kullanıcı bilgileri güncellendiğinde",
+        "description_en": "When user information is updated"
+    },
+    {
+        "event": "user.deleted",
+        "description": "Kullanıcı silindiğinde",
+        "description_en": "When a user is deleted"
+    },
+    {
+        "event": "tenant.updated",
+        "description": "Şirket bilgileri güncellendiğinde",
+        "description_en": "When tenant information is updated"
+    },
+    {
+        "event": "subscription.upgraded",
+        "description": "Abonelik yükseltildiğinde",
+        "description_en": "When subscription is upgraded"
+    },
+    {
+        "event": "integration.configured",
+        "description": "Entegrasyon yapılandırıldığında",
+        "description_en": "When integration is configured"
+    },
+    {
+        "event": "sms.sent",
+        "description": "SMS gönderildiğinde",
+        "description_en": "When SMS is sent"
+    },
+    {
+        "event": "sms.delivered",
+        "description": "SMS teslim edildiğinde",
+        "description_en": "When SMS is delivered"
+    },
+    {
+        "event": "whatsapp.sent",
+        "description": "WhatsApp mesajı gönderildiğinde",
+        "description_en": "When WhatsApp message is sent"
+    },
+    {
+        "event": "whatsapp.delivered",
+        "description": "WhatsApp mesajı teslim edildiğinde",
+        "description_en": "When WhatsApp message is delivered"
+    },
+    {
+        "event": "kvkk.consent_given",
+        "description": "KVKK onayı verildiğinde",
+        "description_en": "When KVKK consent is given"
+    },
+    {
+        "event": "kvkk.consent_withdrawn",
+        "description": "KVKK onayı geri çekildiğinde",
+        "description_en": "When KVKK consent is withdrawn"
+    },
+    {
+        "event": "kvkk.data_exported",
+        "description": "Veri dışa aktarıldığında",
+        "description_en": "When data is exported"
+    },
+    {
+        "event": "kvkk.data_anonymized",
+        "description": "Veri anonimleştirildiğinde",
+        "description_en": "When data is anonymized"
+    }
+)
+VALID_EVENTS: FrozenSet[str] = frozenset(event["event"] for event in AVAILABLE_EVENTS)
+_VALID_EVENTS_LIST: List[str] = [event["event"] for event in AVAILABLE_EVENTS]
+_AVAILABLE_EVENTS_BYTES = orjson.dumps(AVAILABLE_EVENTS)
+_AVAILABLE_EVENTS_TR_BYTES = orjson.dumps([
+    {"event": event["event"], "description": event["description"]}
+    for event in AVAILABLE_EVENTS
+])
+_AVAILABLE_EVENTS_EN_BYTES = orjson.dumps([
+    {"event": event["event"], "description": event["description_en"]}
+    for event in AVAILABLE_EVENTS
+])
+
+
+def _available_events_bytes(accept_language: Optional[str]) -> bytes:
+    """
+    Pick the pre-serialized event catalogue for the client's language
+    
+    Args:
+        accept_language: Accept-Language header value, if sent
+        
+    Returns:
+        bytes: Single-locale catalogue for tr/en clients, bilingual otherwise
+    """
+    if not accept_language:
+        return _AVAILABLE_EVENTS_BYTES
+    
+    language = accept_language.lstrip()[:2].lower()
+    if language == "tr":
+        return _AVAILABLE_EVENTS_TR_BYTES
+    if language == "en":
+        return _AVAILABLE_EVENTS_EN_BYTES
+    return _AVAILABLE_EVENTS_BYTES
+
+
+def _validate_events(events: List[str]) -> None:
+    """
+    Raise 400 for the first event that is not a known webhook event
+    
+    Args:
+        events: Requested event names
+    """
+    invalid = set(events).difference(VALID_EVENTS)
+    if not invalid:
+        return
+    
+    invalid_events = sorted(invalid)
+    event = invalid_events[0]
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "error": "invalid_event",
+            "message": f"Geçersiz event: {event}",
+            "message_en": f"Invalid event: {event}",
+            "invalid_events": invalid_events,
+            "valid_events": _VALID_EVENTS_LIST
+        }
+    )
+
+
+async def _get_webhook(tenant_id: str, webhook_id: str) -> Dict[str, Any]:
+    """
+    Get webhook lookup result, served from Redis when cached
+    
+    Credentials are stripped before caching, so neither the cache nor the
+    returned webhook carries the HMAC secret. Redis failures are treated as a
+    cache miss.
+    
+    Args:
+        tenant_id: Tenant UUID
+        webhook_id: Webhook ID
+        
+    Returns:
+        Dict[str, Any]: tenant_service.get_webhook_by_id result without credentials
+    """
+    cache_key = WEBHOOK_CACHE_KEY.format(tenant_id=tenant_id, webhook_id=webhook_id)
+    try:
+        cached = await redis_client.get(cache_key)
+    except redis.RedisError as e:
+        logger.warning("Webhook cache read failed", error=str(e))
+        cached = None
+    if cached is not None:
+        return {"success": True, "webhook": orjson.loads(cached)}
+    
+    result = await tenant_service.get_webhook_by_id(tenant_id, webhook_id)
+    if not result["success"]:
+        return result
+    
+    webhook = {
+        key: value for key, value in result["webhook"].items()
+        if key not in WEBHOOK_CREDENTIAL_FIELDS
+    }
+    try:
+        await redis_client.setex(cache_key, WEBHOOK_CACHE_TTL, orjson.dumps(webhook))
+    except redis.RedisError as e:
+        logger.warning("Webhook cache write failed", error=str(e))
+    
+    return {**result, "webhook": webhook}
+
+
+async def _invalidate_webhook(tenant_id: str, webhook_id: str) -> None:
+    """Drop a cached webhook after it is changed or deleted"""
+    try:
+        await redis_client.delete(WEBHOOK_CACHE_KEY.format(tenant_id=tenant_id, webhook_id=webhook_id))
+    except redis.RedisError as e:
+        logger.warning("Webhook cache invalidation failed", webhook_id=webhook_id, error=str(e))
+
+
+# Formatted UTC timestamp, refreshed at most once per second
+_TS_CACHE: List[Any] = [0, ""]
+
+
+def _iso_now() -> str:
+    """
+    Get the current UTC time as ISO 8601, at one-second resolution
+    
+    Returns:
+        str: Cached timestamp string for the current second
+    """
+    second = int(time.time())
+    if second != _TS_CACHE[0]:
+        _TS_CACHE[0] = second
+        _TS_CACHE[1] = datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+    return _TS_CACHE[1]
+
+
+_WEBHOOK_QUEUE_FULL_DETAIL = {
+    "error": "webhook_queue_full",
+    "message": "Webhook kuyruğu dolu, lütfen daha sonra tekrar deneyin",
+    "message_en": "Webhook queue is full, please retry later"
+}
+
+
+async def _enqueue_delivery(**delivery: Any) -> None:
+    """Queue a webhook delivery, answering 503 when the queue is saturated"""
+    try:
+        await webhook_dispatcher.enqueue(**delivery)
+    except WebhookQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=_WEBHOOK_QUEUE_FULL_DETAIL
+        ) from None
 
 
 class WebhookCreateRequest(BaseModel):
     """Webhook creation request"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     name: str = Field(..., min_length=2, max_length=100)
     url: HttpUrl = Field(..., description="Webhook endpoint URL")
-    events: List[str] = Field(..., min_items=1, description="List of events to subscribe to")
+    events: List[str] = Field(..., min_length=1, description="List of events to subscribe to")
     secret: Optional[str] = Field(None, min_length=32, max_length=128, description="Webhook secret for HMAC verification")
     is_active: bool = Field(default=True)
     retry_count: int = Field(default=3, ge=0, le=10)
@@ -31,9 +265,11 @@ class WebhookCreateRequest(BaseModel):
 
 class WebhookUpdateRequest(BaseModel):
     """Webhook update request"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     name: Optional[str] = Field(None, min_length=2, max_length=100)
     url: Optional[HttpUrl] = None
-    events: Optional[List[str]] = Field(None, min_items=1)
+    events: Optional[List[str]] = Field(None, min_length=1)
     secret: Optional[str] = Field(None, min_length=32, max_length=128)
     is_active: Optional[bool] = None
     retry_count: Optional[int] = Field(None, ge=0, le=10)
@@ -41,613 +277,514 @@ class WebhookUpdateRequest(BaseModel):
 
 
 @router.get("/")
+@handle_endpoint_errors(
+    "Get webhooks error",
+    "get_webhooks_error",
+    "Webhook'lar alınırken hata oluştu",
+    "Error getting webhooks"
+)
 async def get_webhooks(
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    request: Request,
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Get all webhooks for tenant
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        
-        result = await tenant_service.get_tenant_webhooks(tenant_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "get_webhooks_error",
-                    "message": result.get("message", "Webhook'lar alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get webhooks")
-                }
-            )
-        
-        return {
-            "success": True,
-            "webhooks": result["webhooks"],
-            "available_events": [
-                {
-                    "event": "user.created",
-                    "description": "Yeni kullanıcı oluşturulduğunda",
-                    "description_en": "When a new user is created"
-                },
-                {
-                    "event": "user.updated", 
-                    "description": "Kullanıcı bilgileri güncellendiğinde",
-                    "description_en": "When user information is updated"
-                },
-                {
-                    "event": "user.deleted",
-                    "description": "Kullanıcı silindiğinde",
-                    "description_en": "When a user is deleted"
-                },
-                {
-                    "event": "tenant.updated",
-                    "description": "Şirket bilgileri güncellendiğinde",
-                    "description_en": "When tenant information is updated"
-                },
-                {
-                    "event": "subscription.upgraded",
-                    "description": "Abonelik yükseltildiğinde",
-                    "description_en": "When subscription is upgraded"
-                },
-                {
-                    "event": "integration.configured",
-                    "description": "Entegrasyon yapılandırıldığında",
-                    "description_en": "When integration is configured"
-                },
-                {
-                    "event": "sms.sent",
-                    "description": "SMS gönderildiğinde",
-                    "description_en": "When SMS is sent"
-                },
-                {
-                    "event": "sms.delivered",
-                    "description": "SMS teslim edildiğinde",
-                    "description_en": "When SMS is delivered"
-                },
-                {
-                    "event": "whatsapp.sent",
-                    "description": "WhatsApp mesajı gönderildiğinde",
-                    "description_en": "When WhatsApp message is sent"
-                },
-                {
-                    "event": "whatsapp.delivered",
-                    "description": "WhatsApp mesajı teslim edildiğinde",
-                    "description_en": "When WhatsApp message is delivered"
-                },
-                {
-                    "event": "kvkk.consent_given",
-                    "description": "KVKK onayı verildiğinde",
-                    "description_en": "When KVKK consent is given"
-                },
-                {
-                    "event": "kvkk.consent_withdrawn",
-                    "description": "KVKK onayı geri çekildiğinde",
-                    "description_en": "When KVKK consent is withdrawn"
-                },
-                {
-                    "event": "kvkk.data_exported",
-                    "description": "Veri dışa aktarıldığında",
-                    "description_en": "When data is exported"
-                },
-                {
-                    "event": "kvkk.data_anonymized",
-                    "description": "Veri anonimleştirildiğinde",
-                    "description_en": "When data is anonymized"
-                }
-            ]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get webhooks error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    
+    result = await tenant_service.get_tenant_webhooks(tenant_id)
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "get_webhooks_error",
-                "message": "Webhook'lar alınırken hata oluştu",
-                "message_en": "Error getting webhooks"
+                "message": result.get("message", "Webhook'lar alınamadı"),
+                "message_en": result.get("message_en", "Failed to get webhooks")
             }
         )
+    
+    return Response(
+        content=(
+            b'{"success":true,"webhooks":' + orjson.dumps(result["webhooks"])
+            + b',"available_events":'
+            + _available_events_bytes(request.headers.get("accept-language"))
+            + b'}'
+        ),
+        media_type="application/json",
+        # Event descriptions are localized, so shared caches must key on language
+        headers={"Vary": "Accept-Language"}
+    )
 
 
 @router.post("/")
+@handle_endpoint_errors(
+    "Create webhook error",
+    "create_webhook_error",
+    "Webhook oluşturma sırasında hata oluştu",
+    "Error creating webhook"
+)
 async def create_webhook(
     request: WebhookCreateRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["webhook:create"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["webhook:create"]))]
 ):
     """
     Create new webhook (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        # Validate events
-        valid_events = [
-            "user.created", "user.updated", "user.deleted",
-            "tenant.updated", "subscription.upgraded", "integration.configured",
-            "sms.sent", "sms.delivered", "whatsapp.sent", "whatsapp.delivered",
-            "kvkk.consent_given", "kvkk.consent_withdrawn", "kvkk.data_exported", "kvkk.data_anonymized"
-        ]
-        
-        for event in request.events:
-            if event not in valid_events:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": "invalid_event",
-                        "message": f"Geçersiz event: {event}",
-                        "message_en": f"Invalid event: {event}",
-                        "valid_events": valid_events
-                    }
-                )
-        
-        result = await tenant_service.create_webhook(
-            tenant_id=tenant_id,
-            name=request.name,
-            url=str(request.url),
-            events=request.events,
-            secret=request.secret,
-            is_active=request.is_active,
-            retry_count=request.retry_count,
-            timeout=request.timeout,
-            created_by=user_id
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "webhook_creation_failed",
-                    "message": result.get("message", "Webhook oluşturulamadı"),
-                    "message_en": result.get("message_en", "Webhook creation failed")
-                }
-            )
-        
-        logger.info(
-            "Webhook created",
-            tenant_id=str(tenant_id),
-            webhook_id=str(result["webhook_id"]),
-            url=str(request.url),
-            events=request.events,
-            created_by=str(user_id)
-        )
-        
-        return {
-            "success": True,
-            "message": "Webhook başarıyla oluşturuldu",
-            "message_en": "Webhook created successfully",
-            "webhook_id": str(result["webhook_id"]),
-            "webhook": result["webhook"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Create webhook error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    # Validate events
+    _validate_events(request.events)
+    
+    result = await tenant_service.create_webhook(
+        tenant_id=tenant_id,
+        name=request.name,
+        url=str(request.url),
+        events=request.events,
+        secret=request.secret,
+        is_active=request.is_active,
+        retry_count=request.retry_count,
+        timeout=request.timeout,
+        created_by=user_id
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "create_webhook_error",
-                "message": "Webhook oluşturma sırasında hata oluştu",
-                "message_en": "Error creating webhook"
+                "error": "webhook_creation_failed",
+                "message": result.get("message", "Webhook oluşturulamadı"),
+                "message_en": result.get("message_en", "Webhook creation failed")
             }
         )
+    
+    # Resolve and handshake with the endpoint before the first delivery
+    webhook_dispatcher.prime_connection(str(request.url))
+    
+    logger.info(
+        "Webhook created",
+        tenant_id=str(tenant_id),
+        webhook_id=str(result["webhook_id"]),
+        url=str(request.url),
+        events=request.events,
+        created_by=str(user_id)
+    )
+    
+    return {
+        "success": True,
+        "message": "Webhook başarıyla oluşturuldu",
+        "message_en": "Webhook created successfully",
+        "webhook_id": str(result["webhook_id"]),
+        "webhook": result["webhook"]
+    }
 
 
 @router.get("/{webhook_id}")
+@handle_endpoint_errors(
+    "Get webhook error",
+    "get_webhook_error",
+    "Webhook bilgileri alınırken hata oluştu",
+    "Error getting webhook information"
+)
 async def get_webhook(
     webhook_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_active_user)
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)]
 ):
     """
     Get specific webhook by ID
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        
-        result = await tenant_service.get_webhook_by_id(tenant_id, webhook_id)
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "webhook_not_found",
-                    "message": "Webhook bulunamadı",
-                    "message_en": "Webhook not found"
-                }
-            )
-        
-        return {
-            "success": True,
-            "webhook": result["webhook"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get webhook error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    
+    result = await _get_webhook(tenant_id, webhook_id)
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail={
-                "error": "get_webhook_error",
-                "message": "Webhook bilgileri alınırken hata oluştu",
-                "message_en": "Error getting webhook information"
+                "error": "webhook_not_found",
+                "message": "Webhook bulunamadı",
+                "message_en": "Webhook not found"
             }
         )
+    
+    return {
+        "success": True,
+        "webhook": result["webhook"]
+    }
 
 
 @router.put("/{webhook_id}")
+@handle_endpoint_errors(
+    "Update webhook error",
+    "update_webhook_error",
+    "Webhook güncelleme sırasında hata oluştu",
+    "Error updating webhook"
+)
 async def update_webhook(
     webhook_id: str,
     request: WebhookUpdateRequest,
-    current_user: Dict[str, Any] = Depends(require_permissions(["webhook:update"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["webhook:update"]))]
 ):
     """
     Update webhook (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        # Prepare update data
-        update_data = {}
-        for field, value in request.dict(exclude_unset=True).items():
-            if value is not None:
-                if field == "url":
-                    update_data[field] = str(value)
-                else:
-                    update_data[field] = value
-        
-        if not update_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "no_data",
-                    "message": "Güncellenecek veri yok",
-                    "message_en": "No data to update"
-                }
-            )
-        
-        # Validate events if provided
-        if "events" in update_data:
-            valid_events = [
-                "user.created", "user.updated", "user.deleted",
-                "tenant.updated", "subscription.upgraded", "integration.configured",
-                "sms.sent", "sms.delivered", "whatsapp.sent", "whatsapp.delivered",
-                "kvkk.consent_given", "kvkk.consent_withdrawn", "kvkk.data_exported", "kvkk.data_anonymized"
-            ]
-            
-            for event in update_data["events"]:
-                if event not in valid_events:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail={
-                            "error": "invalid_event",
-                            "message": f"Geçersiz event: {event}",
-                            "message_en": f"Invalid event: {event}",
-                            "valid_events": valid_events
-                        }
-                    )
-        
-        result = await tenant_service.update_webhook(
-            tenant_id=tenant_id,
-            webhook_id=webhook_id,
-            update_data=update_data,
-            updated_by=user_id
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "webhook_update_failed",
-                    "message": result.get("message", "Webhook güncellenemedi"),
-                    "message_en": result.get("message_en", "Webhook update failed")
-                }
-            )
-        
-        logger.info(
-            "Webhook updated",
-            tenant_id=str(tenant_id),
-            webhook_id=webhook_id,
-            updated_by=str(user_id),
-            fields=list(update_data.keys())
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    # Prepare update data
+    update_data = request.model_dump(exclude_unset=True, exclude_none=True, mode="json")
+    
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "no_data",
+                "message": "Güncellenecek veri yok",
+                "message_en": "No data to update"
+            }
         )
-        
-        return {
-            "success": True,
-            "message": "Webhook başarıyla güncellendi",
-            "message_en": "Webhook updated successfully",
-            "webhook": result["webhook"]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Update webhook error", error=str(e))
+    
+    # Validate events if provided
+    if "events" in update_data:
+        _validate_events(update_data["events"])
+    
+    result = await tenant_service.update_webhook(
+        tenant_id=tenant_id,
+        webhook_id=webhook_id,
+        update_data=update_data,
+        updated_by=user_id
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "update_webhook_error",
-                "message": "Webhook güncelleme sırasında hata oluştu",
-                "message_en": "Error updating webhook"
+                "error": "webhook_update_failed",
+                "message": result.get("message", "Webhook güncellenemedi"),
+                "message_en": result.get("message_en", "Webhook update failed")
             }
         )
+    
+    await _invalidate_webhook(tenant_id, webhook_id)
+    
+    logger.info(
+        "Webhook updated",
+        tenant_id=str(tenant_id),
+        webhook_id=webhook_id,
+        updated_by=str(user_id),
+        fields=list(update_data.keys())
+    )
+    
+    return {
+        "success": True,
+        "message": "Webhook başarıyla güncellendi",
+        "message_en": "Webhook updated successfully",
+        "webhook": result["webhook"]
+    }
 
 
 @router.delete("/{webhook_id}")
+@handle_endpoint_errors(
+    "Delete webhook error",
+    "delete_webhook_error",
+    "Webhook silme sırasında hata oluştu",
+    "Error deleting webhook"
+)
 async def delete_webhook(
     webhook_id: str,
-    current_user: Dict[str, Any] = Depends(require_permissions(["webhook:delete"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["webhook:delete"]))]
 ):
     """
     Delete webhook (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        result = await tenant_service.delete_webhook(
-            tenant_id=tenant_id,
-            webhook_id=webhook_id,
-            deleted_by=user_id
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "webhook_delete_failed",
-                    "message": result.get("message", "Webhook silinemedi"),
-                    "message_en": result.get("message_en", "Webhook delete failed")
-                }
-            )
-        
-        logger.info(
-            "Webhook deleted",
-            tenant_id=str(tenant_id),
-            webhook_id=webhook_id,
-            deleted_by=str(user_id)
-        )
-        
-        return {
-            "success": True,
-            "message": "Webhook başarıyla silindi",
-            "message_en": "Webhook deleted successfully"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Delete webhook error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    result = await tenant_service.delete_webhook(
+        tenant_id=tenant_id,
+        webhook_id=webhook_id,
+        deleted_by=user_id
+    )
+    
+    if not result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "delete_webhook_error",
-                "message": "Webhook silme sırasında hata oluştu",
-                "message_en": "Error deleting webhook"
+                "error": "webhook_delete_failed",
+                "message": result.get("message", "Webhook silinemedi"),
+                "message_en": result.get("message_en", "Webhook delete failed")
             }
         )
+    
+    await _invalidate_webhook(tenant_id, webhook_id)
+    
+    logger.info(
+        "Webhook deleted",
+        tenant_id=str(tenant_id),
+        webhook_id=webhook_id,
+        deleted_by=str(user_id)
+    )
+    
+    return {
+        "success": True,
+        "message": "Webhook başarıyla silindi",
+        "message_en": "Webhook deleted successfully"
+    }
 
 
 @router.post("/{webhook_id}/test")
+@handle_endpoint_errors(
+    "Test webhook error",
+    "test_webhook_error",
+    "Webhook test sırasında hata oluştu",
+    "Error testing webhook"
+)
 async def test_webhook(
     webhook_id: str,
-    background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(require_permissions(["webhook:test"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["webhook:test"]))]
 ):
     """
     Test webhook by sending a test event (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        # Get webhook details
-        webhook_result = await tenant_service.get_webhook_by_id(tenant_id, webhook_id)
-        
-        if not webhook_result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "webhook_not_found",
-                    "message": "Webhook bulunamadı",
-                    "message_en": "Webhook not found"
-                }
-            )
-        
-        webhook = webhook_result["webhook"]
-        
-        # Create test payload
-        test_payload = {
-            "event": "webhook.test",
-            "timestamp": datetime.utcnow().isoformat(),
-            "tenant_id": str(tenant_id),
-            "webhook_id": webhook_id,
-            "test": True,
-            "data": {
-                "message": "Bu bir test webhook'udur",
-                "message_en": "This is a test webhook",
-                "triggered_by": str(user_id)
-            }
-        }
-        
-        # Schedule webhook delivery
-        background_tasks.add_task(
-            tenant_service.send_webhook,
-            webhook_id=webhook_id,
-            payload=test_payload
-        )
-        
-        logger.info(
-            "Webhook test triggered",
-            tenant_id=str(tenant_id),
-            webhook_id=webhook_id,
-            url=webhook["url"],
-            triggered_by=str(user_id)
-        )
-        
-        return {
-            "success": True,
-            "message": "Test webhook'u gönderildi",
-            "message_en": "Test webhook sent",
-            "test_payload": test_payload
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Test webhook error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    # Get webhook details
+    webhook_result = await _get_webhook(tenant_id, webhook_id)
+    
+    if not webhook_result["success"]:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail={
-                "error": "test_webhook_error",
-                "message": "Webhook test sırasında hata oluştu",
-                "message_en": "Error testing webhook"
+                "error": "webhook_not_found",
+                "message": "Webhook bulunamadı",
+                "message_en": "Webhook not found"
             }
         )
+    
+    webhook = webhook_result["webhook"]
+    
+    # Create test payload
+    test_payload = {
+        "event": "webhook.test",
+        "timestamp": _iso_now(),
+        "tenant_id": str(tenant_id),
+        "webhook_id": webhook_id,
+        "test": True,
+        "data": {
+            "message": "Bu bir test webhook'udur",
+            "message_en": "This is a test webhook",
+            "triggered_by": str(user_id)
+        }
+    }
+    
+    # Queue webhook delivery; the worker loads the URL and secret itself
+    await _enqueue_delivery(
+        tenant_id=str(tenant_id),
+        webhook_id=webhook_id,
+        payload=test_payload
+    )
+    
+    logger.info(
+        "Webhook test triggered",
+        tenant_id=str(tenant_id),
+        webhook_id=webhook_id,
+        url=webhook["url"],
+        triggered_by=str(user_id)
+    )
+    
+    return {
+        "success": True,
+        "message": "Test webhook'u gönderildi",
+        "message_en": "Test webhook sent",
+        "test_payload": test_payload
+    }
 
 
 @router.get("/{webhook_id}/logs")
+@handle_endpoint_errors(
+    "Get webhook logs error",
+    "get_logs_error",
+    "Webhook logları alınırken hata oluştu",
+    "Error getting webhook logs"
+)
 async def get_webhook_logs(
     webhook_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_active_user),
+    current_user: Annotated[AuthUser, Depends(get_current_active_user)],
     limit: int = 50,
     offset: int = 0
 ):
     """
     Get webhook delivery logs
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        
-        result = await tenant_service.get_webhook_logs(
-            tenant_id=tenant_id,
-            webhook_id=webhook_id,
-            limit=limit,
-            offset=offset
-        )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "get_logs_error",
-                    "message": result.get("message", "Webhook logları alınamadı"),
-                    "message_en": result.get("message_en", "Failed to get webhook logs")
-                }
-            )
-        
-        return {
-            "success": True,
-            "logs": result["logs"],
-            "total": result["total"],
-            "limit": limit,
-            "offset": offset
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Get webhook logs error", error=str(e))
+    tenant_id = current_user.tenant_id_str
+    
+    result = await tenant_service.get_webhook_logs(
+        tenant_id=tenant_id,
+        webhook_id=webhook_id,
+        limit=limit,
+        offset=offset
+    )
+    
+    if not result["success"]:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "get_logs_error",
-                "message": "Webhook logları alınırken hata oluştu",
-                "message_en": "Error getting webhook logs"
+                "message": result.get("message", "Webhook logları alınamadı"),
+                "message_en": result.get("message_en", "Failed to get webhook logs")
             }
         )
+    
+    return {
+        "success": True,
+        "logs": result["logs"],
+        "total": result["total"],
+        "limit": limit,
+        "offset": offset
+    }
 
 
 @router.post("/delivery/{delivery_id}/retry")
+@handle_endpoint_errors(
+    "Retry webhook delivery error",
+    "retry_error",
+    "Webhook yeniden gönderim sırasında hata oluştu",
+    "Error retrying webhook delivery"
+)
 async def retry_webhook_delivery(
     delivery_id: str,
-    background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(require_permissions(["webhook:retry"]))
+    current_user: Annotated[AuthUser, Depends(require_permissions(["webhook:retry"]))]
 ):
     """
     Retry failed webhook delivery (admin only)
     """
-    try:
-        tenant_id = current_user["tenant_id"]
-        user_id = current_user["sub"]
-        
-        result = await tenant_service.retry_webhook_delivery(
-            tenant_id=tenant_id,
-            delivery_id=delivery_id,
-            retried_by=user_id
+    tenant_id = current_user.tenant_id_str
+    user_id = current_user.sub_str
+    
+    result = await tenant_service.retry_webhook_delivery(
+        tenant_id=tenant_id,
+        delivery_id=delivery_id,
+        retried_by=user_id
+    )
+    
+    if not result["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "retry_failed",
+                "message": result.get("message", "Webhook yeniden gönderim başarısız"),
+                "message_en": result.get("message_en", "Webhook retry failed")
+            }
         )
-        
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "retry_failed",
-                    "message": result.get("message", "Webhook yeniden gönderim başarısız"),
-                    "message_en": result.get("message_en", "Webhook retry failed")
-                }
-            )
-        
-        # Schedule retry
-        background_tasks.add_task(
-            tenant_service.send_webhook,
+    
+    # Queue retry after a jittered backoff
+    try:
+        retry_delay = await webhook_dispatcher.schedule_retry(
+            result.get("attempt", 1),
+            tenant_id=str(tenant_id),
             webhook_id=result["webhook_id"],
             payload=result["payload"],
             delivery_id=delivery_id
         )
-        
-        logger.info(
-            "Webhook delivery retried",
-            tenant_id=str(tenant_id),
-            delivery_id=delivery_id,
-            retried_by=str(user_id)
+    except WebhookQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=_WEBHOOK_QUEUE_FULL_DETAIL
+        ) from None
+    
+    logger.info(
+        "Webhook delivery retried",
+        tenant_id=str(tenant_id),
+        delivery_id=delivery_id,
+        retried_by=str(user_id)
+    )
+    
+    return {
+        "success": True,
+        "message": "Webhook yeniden gönderimi başlatıldı",
+        "message_en": "Webhook retry initiated",
+        "retry_in_seconds": round(retry_delay, 3)
+    }
+
+
+# Webhook receivers for external services
+_INVALID_SIGNATURE_DETAIL = {
+    "error": "invalid_signature",
+    "message": "Geçersiz webhook imzası",
+    "message_en": "Invalid webhook signature"
+}
+
+
+def _verify_netgsm_signature(raw_body: bytes, signature: Optional[str]) -> None:
+    """
+    Check a NetGSM HMAC-SHA256 signature in constant time
+    
+    Args:
+        raw_body: Request body bytes exactly as received
+        signature: Hex signature from the X-Signature header
+    """
+    if not signature:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_INVALID_SIGNATURE_DETAIL
         )
-        
-        return {
-            "success": True,
-            "message": "Webhook yeniden gönderimi başlatıldı",
-            "message_en": "Webhook retry initiated"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Retry webhook delivery error", error=str(e))
+    
+    try:
+        provided = binascii.unhexlify(signature)
+    except (binascii.Error, ValueError):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "retry_error",
-                "message": "Webhook yeniden gönderim sırasında hata oluştu",
-                "message_en": "Error retrying webhook delivery"
-            }
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_INVALID_SIGNATURE_DETAIL
+        ) from None
+    
+    expected = hmac.new(
+        settings.netgsm_webhook_secret.encode(), raw_body, hashlib.sha256
+    ).digest()
+    if not hmac.compare_digest(expected, provided):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_INVALID_SIGNATURE_DETAIL
         )
 
 
-# Webhook receivers for external services
 @router.post("/receive/netgsm")
 async def receive_netgsm_webhook(request: Request):
     """
     Receive delivery reports from NetGSM
     """
     try:
-        payload = await request.json()
+        raw_body = await request.body()
+        
+        # Verify the HMAC over the unmodified body when a secret is configured
+        if settings.netgsm_webhook_secret:
+            _verify_netgsm_signature(raw_body, request.headers.get("X-Signature"))
+        
+        try:
+            payload = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "invalid_json",
+                    "message": "Geçersiz JSON gövdesi",
+                    "message_en": "Invalid JSON body"
+                }
+            )
         
         # Process NetGSM delivery report
         # This would typically update message status and trigger tenant webhooks
         logger.info("NetGSM webhook received", payload=payload)
         
         # Here you would:
-        # 1. Validate the webhook signature if NetGSM provides one
-        # 2. Update message delivery status in database
-        # 3. Trigger tenant webhooks for sms.delivered or whatsapp.delivered events
+        # 1. Update message delivery status in database
+        # 2. Trigger tenant webhooks for sms.delivered or whatsapp.delivered events
         
         return {"success": True, "message": "Webhook received"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("NetGSM webhook error", error=str(e))
         raise HTTPException(
@@ -656,25 +793,24 @@ async def receive_netgsm_webhook(request: Request):
         )
 
 
+# Constant /status payload, serialized once at import
+_STATUS_BYTES = orjson.dumps({
+    "status": "active",
+    "service": "Webhook API",
+    "version": "1.0.0",
+    "features": [
+        "Webhook Management",
+        "Event Subscriptions", 
+        "HMAC Signature Verification",
+        "Delivery Retry Logic",
+        "Delivery Logs",
+        "External Webhook Receivers"
+    ],
+    "supported_events": _VALID_EVENTS_LIST
+})
+
+
 @router.get("/status")
 async def webhook_status():
     """Get webhook service status"""
-    return {
-        "status": "active",
-        "service": "Webhook API",
-        "version": "1.0.0",
-        "features": [
-            "Webhook Management",
-            "Event Subscriptions", 
-            "HMAC Signature Verification",
-            "Delivery Retry Logic",
-            "Delivery Logs",
-            "External Webhook Receivers"
-        ],
-        "supported_events": [
-            "user.created", "user.updated", "user.deleted",
-            "tenant.updated", "subscription.upgraded", "integration.configured",
-            "sms.sent", "sms.delivered", "whatsapp.sent", "whatsapp.delivered",
-            "kvkk.consent_given", "kvkk.consent_withdrawn", "kvkk.data_exported", "kvkk.data_anonymized"
-        ]
-    }
\ No newline at end of file
+    return Response(content=_STATUS_BYTES, media_type="application/json")
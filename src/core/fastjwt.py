@@ -0,0 +1,119 @@
+"""
+Fixed-shape HS256 JWT codec for Turkish Business Integration Platform
+
+Every token this platform issues has the same header, so when
+``settings.algorithm`` is HS256 the header segment is precomputed, the keyed
+HMAC state is built once and encode/decode reduce to base64url + one HMAC.
+Errors are raised as PyJWT exceptions so callers handle both paths alike.
+"""
+
+import base64
+import binascii
+import calendar
+import hashlib
+import hmac
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+import jwt
+import orjson
+
+from src.config import settings
+
+# True when tokens should go through this codec instead of PyJWT
+ENABLED = settings.algorithm == "HS256"
+
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_HEADER_B64 = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+_KEYED_HMAC = hmac.new(settings.secret_key.encode(), digestmod=hashlib.sha256)
+
+
+def _sign(signing_input: bytes) -> bytes:
+    mac = _KEYED_HMAC.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def encode(payload: Dict[str, Any]) -> str:
+    """
+    Encode claims as an HS256 JWT
+    
+    Args:
+        payload: Token claims; datetime exp/iat/nbf become epoch seconds
+    
+    Returns:
+        str: Signed token
+    """
+    claims = dict(payload)
+    for claim in _TIME_CLAIMS:
+        value = claims.get(claim)
+        if isinstance(value, datetime):
+            claims[claim] = calendar.timegm(value.utctimetuple())
+    
+    signing_input = _HEADER_B64 + b"." + _b64url_encode(orjson.dumps(claims))
+    return (signing_input + b"." + _b64url_encode(_sign(signing_input))).decode("ascii")
+
+
+def decode(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 JWT and return its claims
+    
+    Args:
+        token: Token to verify
+    
+    Returns:
+        Dict[str, Any]: Token claims
+    
+    Raises:
+        jwt.ExpiredSignatureError: If exp has passed
+        jwt.InvalidTokenError: If the token is malformed, has a different
+            header or its signature does not match
+    """
+    try:
+        header, payload, signature = token.encode("ascii").split(b".")
+    except (UnicodeEncodeError, ValueError):
+        raise jwt.DecodeError("Not enough segments")
+    
+    if header != _HEADER_B64:
+        raise jwt.InvalidAlgorithmError("Unexpected token header")
+    
+    try:
+        provided = _b64url_decode(signature)
+    except (binascii.Error, ValueError):
+        raise jwt.DecodeError("Invalid signature encoding")
+    
+    if not hmac.compare_digest(_sign(header + b"." + payload), provided):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    
+    try:
+        claims = orjson.loads(_b64url_decode(payload))
+    except (binascii.Error, ValueError):
+        raise jwt.DecodeError("Invalid payload encoding")
+    
+    if not isinstance(claims, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    
+    now = time.time()
+    exp = claims.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be a number")
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    
+    nbf = claims.get("nbf")
+    if nbf is not None and isinstance(nbf, (int, float)) and nbf > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    
+    return claims
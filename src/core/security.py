@@ -2,31 +2,208 @@
 Security utilities for Turkish Business Integration Platform
 """
 
-import uuid
+import asyncio
+import base64
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, Set, Tuple, Union
+from uuid import UUID
 import secrets
-import hashlib
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+import bcrypt
+from cachetools import TTLCache
+import jwt
+from jwt.algorithms import get_default_algorithms
+import orjson
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 import structlog
 
 from src.config import settings
+from src.core import fastjwt
 
 logger = structlog.get_logger(__name__)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (bcrypt only uses the first 72 bytes of a password)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# bcrypt releases the GIL, so hashing threads run on separate cores
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+
+def _hash_password_sync(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds, prefix=b"2b")
+    return bcrypt.hashpw(password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], salt).decode()
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode()
+        )
+    except ValueError:
+        # Not a bcrypt hash
+        return False
 
 # HTTP Bearer scheme for API authentication
 security = HTTPBearer()
 
 # Redis client for token blacklisting and storage
-redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+redis_client = redis.from_url(settings.redis_url)
+
+# Short-lived in-process view of the Redis blacklist, keyed by jti. A token
+# revoked on another instance may be accepted here until its entry expires.
+_JTI_NOT_REVOKED: TTLCache = TTLCache(
+    maxsize=settings.token_blacklist_cache_size,
+    ttl=settings.token_blacklist_cache_ttl
+)
+_JTI_REVOKED: TTLCache = TTLCache(
+    maxsize=settings.token_blacklist_cache_size,
+    ttl=settings.token_blacklist_cache_ttl
+)
+
+# Keys checked per pipeline in cleanup_expired_tokens
+TOKEN_CLEANUP_BATCH_SIZE = 500
+
+# Accepted JWT algorithms, built once instead of per decode
+_JWT_ALGORITHMS = [settings.algorithm]
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with claims serialized and parsed by orjson"""
+    
+    def _encode_payload(self, payload: Dict[str, Any], headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+    
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+
+def _encode_token(claims: Dict[str, Any]) -> str:
+    """Sign claims with the fixed HS256 codec when configured, else PyJWT"""
+    if fastjwt.ENABLED:
+        return fastjwt.encode(claims)
+    return _jwt.encode(claims, get_signing_key(), algorithm=settings.algorithm)
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Verify a token with the fixed HS256 codec when configured, else PyJWT"""
+    if fastjwt.ENABLED:
+        return fastjwt.decode(token)
+    return _jwt.decode(token, get_verification_key(), algorithms=_JWT_ALGORITHMS)
+
+
+@lru_cache(maxsize=1)
+def _jwt_keys() -> Tuple[Any, Any]:
+    """Parse settings.secret_key once into (signing, verification) keys"""
+    signing_key = get_default_algorithms()[settings.algorithm].prepare_key(settings.secret_key)
+    # Asymmetric algorithms verify with the public half of the private key
+    public_key = getattr(signing_key, "public_key", None)
+    return signing_key, public_key() if public_key else signing_key
+
+
+def get_signing_key() -> Any:
+    """
+    Get the parsed JWT signing key
+    
+    The key material is parsed (PEM/HMAC preparation) on first use and the
+    resulting key object is reused for every encode.
+    
+    Returns:
+        Any: HMAC key bytes or cryptography private key for settings.algorithm
+    """
+    return _jwt_keys()[0]
+
+
+def get_verification_key() -> Any:
+    """
+    Get the parsed JWT verification key
+    
+    Returns:
+        Any: HMAC key bytes or cryptography public key for settings.algorithm
+    """
+    return _jwt_keys()[1]
+
+
+class _RevocationBatcher:
+    """
+    Coalesce concurrent blacklist lookups into one Redis MGET
+    
+    Lookups wait at most ``max_delay`` seconds, or until ``max_batch`` jtis are
+    pending, and then share a single round-trip.
+    """
+    
+    def __init__(self, max_batch: int = 64, max_delay: float = 0.001):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether jti is on the Redis blacklist
+        
+        Args:
+            jti: JWT ID
+            
+        Returns:
+            bool: True if the token has been revoked
+        """
+        future = self._pending.get(jti)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[jti] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_delay, self._flush)
+        
+        # Shielded so one cancelled caller does not fail the shared lookup
+        return await asyncio.shield(future)
+    
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _resolve(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            values = await redis_client.mget([f"blacklist:{jti}" for jti in batch])
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for future, value in zip(batch.values(), values):
+            if not future.done():
+                future.set_result(value is not None)
+
+
+_revocation_batcher = _RevocationBatcher()
 
 
 class SecurityError(Exception):
@@ -49,6 +226,44 @@ class TokenExpiredError(SecurityError):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """
+    Authenticated user resolved from access token claims
+    
+    Endpoints read ``tenant_id``/``sub``/``permissions`` as attributes. The raw
+    claims stay reachable through ``claims`` and mapping-style access
+    (``current_user["email"]``) for callers that still expect a dict.
+    """
+    tenant_id: UUID
+    sub: UUID
+    permissions: FrozenSet[str]
+    claims: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    tenant_id_str: str = field(init=False, repr=False, compare=False)
+    sub_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # String forms are computed once for log/task kwargs on the hot path
+        object.__setattr__(self, "tenant_id_str", str(self.tenant_id))
+        object.__setattr__(self, "sub_str", str(self.sub))
+    
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "AuthUser":
+        """Build AuthUser from a verified token payload"""
+        return cls(
+            tenant_id=UUID(str(claims["tenant_id"])),
+            sub=UUID(str(claims["sub"])),
+            permissions=frozenset(claims.get("permissions", ())),
+            claims=claims
+        )
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.claims[key]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.claims.get(key, default)
+
+
 class TokenService:
     """
     JWT token management service for Turkish Business Integration Platform
@@ -66,9 +281,9 @@ class TokenService:
         return secrets.token_hex(32)
     
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> str:
         """
-        Hash password using bcrypt
+        Hash password using bcrypt on the bcrypt thread pool
         
         Args:
             password: Plain text password
@@ -76,12 +291,13 @@ class TokenService:
         Returns:
             str: Hashed password
         """
-        return pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_BCRYPT_POOL, _hash_password_sync, password)
     
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
         """
-        Verify password against hash
+        Verify password against hash on the bcrypt thread pool
         
         Args:
             plain_password: Plain text password
@@ -90,7 +306,10 @@ class TokenService:
         Returns:
             bool: True if password matches
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _BCRYPT_POOL, _verify_password_sync, plain_password, hashed_password
+        )
     
     @staticmethod
     async def create_access_token(data: Dict[str, Any]) -> str:
@@ -104,13 +323,14 @@ class TokenService:
             str: JWT access token
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        now = datetime.utcnow()
+        expire = now + timedelta(minutes=settings.access_token_expire_minutes)
         
         to_encode.update({
             "exp": expire,
             "type": "access",
-            "iat": datetime.utcnow(),
-            "jti": str(uuid.uuid4()),  # JWT ID for blacklisting
+            "iat": now,
+            "jti": secrets.token_urlsafe(16),  # JWT ID for blacklisting
         })
         
         # Ensure required fields
@@ -119,7 +339,10 @@ class TokenService:
         if "tenant_id" not in to_encode:
             raise ValueError("Token must include 'tenant_id' field")
         
-        token = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        # PyJWT requires a string subject
+        to_encode["sub"] = str(to_encode["sub"])
+        
+        token = _encode_token(to_encode)
         
         logger.info(
             "Access token created",
@@ -131,34 +354,39 @@ class TokenService:
         return token
     
     @staticmethod
-    async def create_refresh_token(data: Dict[str, Any]) -> str:
+    async def create_refresh_token(data: Dict[str, Any], pipe: Optional[Pipeline] = None) -> str:
         """
         Create JWT refresh token (long-lived)
         
         Args:
             data: Token payload data
+            pipe: Redis pipeline to queue the token write on; the caller executes it
             
         Returns:
             str: JWT refresh token
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+        now = datetime.utcnow()
+        expire = now + timedelta(days=settings.refresh_token_expire_days)
+        jti = secrets.token_bytes(16)
         
         to_encode.update({
             "exp": expire,
             "type": "refresh",
-            "iat": datetime.utcnow(),
-            "jti": str(uuid.uuid4()),
+            "iat": now,
+            "jti": base64.urlsafe_b64encode(jti).rstrip(b"=").decode(),
         })
+        to_encode["sub"] = str(to_encode["sub"])
         
-        token = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        token = _encode_token(to_encode)
         
         # Store refresh token in Redis with expiration
-        await redis_client.setex(
-            f"refresh_token:{to_encode['sub']}:{to_encode['jti'][-8:]}",
-            settings.refresh_token_expire_days * 86400,
-            token
-        )
+        key = b"refresh_token:%s:%s" % (to_encode["sub"].encode(), jti)
+        ttl = settings.refresh_token_expire_days * 86400
+        if pipe is not None:
+            pipe.setex(key, ttl, token)
+        else:
+            await redis_client.setex(key, ttl, token)
         
         logger.info(
             "Refresh token created",
@@ -187,7 +415,7 @@ class TokenService:
         """
         try:
             # Decode token
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+            payload = _decode_token(token)
             
             # Check token type
             if payload.get("type") != token_type:
@@ -197,7 +425,7 @@ class TokenService:
             
             # Check if token is blacklisted
             jti = payload.get("jti")
-            if jti and await redis_client.exists(f"blacklist:{jti}"):
+            if jti and await TokenService.is_token_revoked(jti):
                 raise AuthenticationError("Token has been revoked")
             
             # Validate required fields
@@ -210,9 +438,32 @@ class TokenService:
             
         except jwt.ExpiredSignatureError:
             raise TokenExpiredError("Token has expired")
-        except JWTError as e:
+        except jwt.PyJWTError as e:
             raise AuthenticationError(f"Token validation failed: {str(e)}")
     
+    @staticmethod
+    async def is_token_revoked(jti: str) -> bool:
+        """
+        Check the token blacklist, consulting the local cache before Redis
+        
+        Args:
+            jti: JWT ID
+            
+        Returns:
+            bool: True if the token has been revoked
+        """
+        if jti in _JTI_NOT_REVOKED:
+            return False
+        if jti in _JTI_REVOKED:
+            return True
+        
+        if await _revocation_batcher.is_revoked(jti):
+            _JTI_REVOKED[jti] = True
+            return True
+        
+        _JTI_NOT_REVOKED[jti] = True
+        return False
+    
     @staticmethod
     async def refresh_access_token(refresh_token: str) -> Dict[str, str]:
         """
@@ -238,11 +489,11 @@ class TokenService:
         
         new_access_token = await TokenService.create_access_token(access_token_data)
         
-        # Optionally rotate refresh token for security
-        new_refresh_token = await TokenService.create_refresh_token(access_token_data)
-        
-        # Blacklist old refresh token
-        await TokenService.blacklist_token(refresh_token)
+        # Rotate the refresh token and blacklist the old one in one round-trip
+        pipe = redis_client.pipeline(transaction=False)
+        new_refresh_token = await TokenService.create_refresh_token(access_token_data, pipe=pipe)
+        await TokenService.blacklist_token(refresh_token, pipe=pipe)
+        await pipe.execute()
         
         return {
             "access_token": new_access_token,
@@ -251,48 +502,83 @@ class TokenService:
         }
     
     @staticmethod
-    async def blacklist_token(token: str) -> bool:
+    async def blacklist_token(token: str, pipe: Optional[Pipeline] = None) -> bool:
         """
         Add token to blacklist (for logout)
         
         Args:
             token: JWT token to blacklist
+            pipe: Redis pipeline to queue the blacklist write on; the caller executes it
             
         Returns:
             bool: True if successfully blacklisted
         """
         try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+            payload = _decode_token(token)
             jti = payload.get("jti")
             exp = payload.get("exp")
             
             if jti and exp:
                 # Calculate remaining TTL
-                ttl = exp - datetime.utcnow().timestamp()
+                ttl = exp - time.time()
                 if ttl > 0:
-                    await redis_client.setex(f"blacklist:{jti}", int(ttl), "revoked")
+                    if pipe is not None:
+                        pipe.setex(f"blacklist:{jti}", int(ttl), "revoked")
+                    else:
+                        await redis_client.setex(f"blacklist:{jti}", int(ttl), "revoked")
+                    _JTI_NOT_REVOKED.pop(jti, None)
+                    _JTI_REVOKED[jti] = True
                     
                     logger.info("Token blacklisted", jti=jti, ttl=int(ttl))
                     return True
             
             return False
             
-        except JWTError:
+        except jwt.PyJWTError:
             return False
     
+    @staticmethod
+    async def _unlink_expired(keys: list) -> int:
+        """
+        Unlink keys without a positive TTL using two pipelined round-trips
+        
+        Args:
+            keys: Blacklist keys to check
+            
+        Returns:
+            int: Number of keys unlinked
+        """
+        pipe = redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+        
+        expired = [key for key, ttl in zip(keys, ttls) if ttl <= 0]
+        if expired:
+            pipe = redis_client.pipeline(transaction=False)
+            for key in expired:
+                pipe.unlink(key)
+            await pipe.execute()
+        
+        return len(expired)
+    
     @staticmethod
     async def cleanup_expired_tokens():
         """Clean up expired tokens from Redis (background task)"""
         try:
-            # Get all blacklisted tokens
-            keys = await redis_client.keys("blacklist:*")
+            # Blacklist keys are written with SETEX and expire on their own; this
+            # only removes entries left without a TTL, in pipelined batches
             expired_count = 0
+            batch = []
             
-            for key in keys:
-                ttl = await redis_client.ttl(key)
-                if ttl <= 0:
-                    await redis_client.delete(key)
-                    expired_count += 1
+            async for key in redis_client.scan_iter(match="blacklist:*", count=1000):
+                batch.append(key)
+                if len(batch) >= TOKEN_CLEANUP_BATCH_SIZE:
+                    expired_count += await TokenService._unlink_expired(batch)
+                    batch = []
+            
+            if batch:
+                expired_count += await TokenService._unlink_expired(batch)
             
             if expired_count > 0:
                 logger.info(f"Cleaned up {expired_count} expired tokens")
@@ -301,14 +587,22 @@ class TokenService:
             logger.error("Token cleanup failed", error=str(e))
 
 
+# Characters that satisfy the special-character password rule
+PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+
 class PasswordService:
     """Password security utilities"""
     
     @staticmethod
-    def generate_password_reset_token(email: str) -> str:
-        """Generate secure password reset token"""
-        data = f"{email}:{datetime.utcnow().timestamp()}:{secrets.token_hex(16)}"
-        return hashlib.sha256(data.encode()).hexdigest()
+    def generate_password_reset_token() -> str:
+        """
+        Generate secure password reset token
+        
+        The token is 32 random bytes and carries no user data; callers bind it
+        to the account where they store it (e.g. a Redis key with a TTL).
+        """
+        return secrets.token_urlsafe(32)
     
     @staticmethod
     def validate_password_strength(password: str) -> Dict[str, Union[bool, str]]:
@@ -328,10 +622,20 @@ class PasswordService:
                 "message_en": "Password must be at least 8 characters"
             }
         
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif c in PASSWORD_SPECIAL_CHARS:
+                has_special = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit and has_special:
+                break
         
         if not (has_upper and has_lower and has_digit and has_special):
             return {
@@ -348,11 +652,18 @@ class PasswordService:
 
 
 # Dependency functions for FastAPI
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+async def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
     """
     FastAPI dependency to get current authenticated user
     
+    Reuses the payload TenantMiddleware already verified for this request's
+    bearer token, and only verifies the token itself otherwise.
+    
     Args:
+        request: Current request
         credentials: HTTP Bearer token
         
     Returns:
@@ -361,6 +672,10 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     Raises:
         HTTPException: If authentication fails
     """
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is not None:
+        return payload
+    
     try:
         token = credentials.credentials
         payload = await TokenService.verify_token(token, "access")
@@ -388,7 +703,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         )
 
 
-async def get_current_active_user(current_user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, Any]:
+async def get_current_active_user(current_user: Dict[str, Any] = Depends(get_current_user)) -> AuthUser:
     """
     FastAPI dependency to get current active user
     
@@ -396,10 +711,10 @@ async def get_current_active_user(current_user: Dict[str, Any] = Depends(get_cur
         current_user: Current user from get_current_user
         
     Returns:
-        Dict[str, Any]: Current active user data
+        AuthUser: Current active user
         
     Raises:
-        HTTPException: If user is not active
+        HTTPException: If user is not active or token claims are malformed
     """
     if current_user.get("is_active") is False:
         raise HTTPException(
@@ -411,7 +726,18 @@ async def get_current_active_user(current_user: Dict[str, Any] = Depends(get_cur
             }
         )
     
-    return current_user
+    try:
+        return AuthUser.from_claims(current_user)
+    except (KeyError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error": "invalid_token",
+                "message": "Geçersiz token",
+                "message_en": "Token claims are malformed"
+            },
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 def require_permissions(required_permissions: list):
@@ -421,22 +747,24 @@ def require_permissions(required_permissions: list):
     Args:
         required_permissions: List of required permission strings
     """
-    def permission_checker(current_user: Dict[str, Any] = Depends(get_current_active_user)):
-        user_permissions = current_user.get("permissions", [])
-        
-        for permission in required_permissions:
-            if permission not in user_permissions:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail={
-                        "error": "insufficient_permissions",
-                        "message": f"'{permission}' yetkisi gerekli",
-                        "message_en": f"Permission '{permission}' required",
-                        "required_permissions": required_permissions,
-                        "user_permissions": user_permissions
-                    }
-                )
+    required = frozenset(required_permissions)
+    
+    def permission_checker(current_user: AuthUser = Depends(get_current_active_user)) -> AuthUser:
+        user_permissions = current_user.permissions
+        
+        if required.issubset(user_permissions):
+            return current_user
         
-        return current_user
+        permission = next(p for p in required_permissions if p not in user_permissions)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "insufficient_permissions",
+                "message": f"'{permission}' yetkisi gerekli",
+                "message_en": f"Permission '{permission}' required",
+                "required_permissions": required_permissions,
+                "user_permissions": sorted(user_permissions)
+            }
+        )
     
     return permission_checker
\ No newline at end of file
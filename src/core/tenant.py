@@ -2,17 +2,50 @@
 Multi-tenant middleware and context management for Turkish Business Integration Platform
 """
 
-import uuid
+import asyncio
+import re
 from contextvars import ContextVar
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
+from cachetools import TTLCache
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+import redis.asyncio as redis
 import structlog
 
+from src.config import settings
+
 logger = structlog.get_logger(__name__)
 
+# Canonical UUID format accepted in X-Tenant-ID
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# Subdomains that never identify a tenant
+RESERVED_SUBDOMAINS = frozenset(("www", "api", "admin"))
+
+# Redis pub/sub channel carrying tenant IDs whose cached info is stale
+TENANT_INVALIDATION_CHANNEL = "tenant:invalidate"
+
+# Backoff bounds (seconds) for re-subscribing after a Redis failure
+INVALIDATION_RECONNECT_MIN_DELAY = 0.5
+INVALIDATION_RECONNECT_MAX_DELAY = 30.0
+
+# Per-process caches in front of the tenant service
+_TENANT_INFO_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=60)
+_SUBDOMAIN_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=60)
+
+# Subscription plans in ascending order
+PLAN_HIERARCHY: Mapping[str, int] = MappingProxyType({
+    "trial": 0,
+    "starter": 1,
+    "professional": 2,
+    "enterprise": 3
+})
+
 # Global tenant context variable
 tenant_context: ContextVar[Optional[str]] = ContextVar("tenant_context", default=None)
 
@@ -32,7 +65,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
     3. Authorization token claims
     """
     
-    EXCLUDED_PATHS = [
+    EXCLUDED_PATHS = (
         "/health",
         "/metrics",
         "/docs",
@@ -41,7 +74,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
         "/favicon.ico",
         "/api/v1/auth/register-tenant",
         "/api/v1/system",
-    ]
+    )
     
     def __init__(self, app):
         super().__init__(app)
@@ -97,13 +130,6 @@ class TenantMiddleware(BaseHTTPMiddleware):
             request.state.tenant_id = tenant_id
             request.state.tenant_info = tenant_info
             
-            # Add structured logging context
-            structlog.contextvars.bind_contextvars(
-                tenant_id=tenant_id,
-                tenant_name=tenant_info.get("name"),
-                tenant_plan=tenant_info.get("plan")
-            )
-            
             response = await call_next(request)
             
             # Add tenant info to response headers (for debugging)
@@ -138,7 +164,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
     
     def _is_excluded_path(self, path: str) -> bool:
         """Check if path should be excluded from tenant processing"""
-        return any(path.startswith(excluded) for excluded in self.EXCLUDED_PATHS)
+        return path.startswith(self.EXCLUDED_PATHS)
     
     async def _extract_tenant_id(self, request: Request) -> Optional[str]:
         """
@@ -156,10 +182,9 @@ class TenantMiddleware(BaseHTTPMiddleware):
             return self._validate_tenant_id(tenant_id)
         
         # Method 2: Extract from subdomain
-        host = request.headers.get("host", "")
-        if "." in host:
-            subdomain = host.split(".")[0]
-            if subdomain and subdomain not in ["www", "api", "admin"]:
+        subdomain, dot, _ = request.headers.get("host", "").partition(".")
+        if dot:
+            if subdomain and subdomain not in RESERVED_SUBDOMAINS:
                 # Convert subdomain to tenant ID (this would typically be a database lookup)
                 return await self._subdomain_to_tenant_id(subdomain)
         
@@ -167,18 +192,13 @@ class TenantMiddleware(BaseHTTPMiddleware):
         auth_header = request.headers.get("Authorization")
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header[7:]
-            return await self._extract_tenant_from_token(token)
+            return await self._extract_tenant_from_token(token, request)
         
         return None
     
     def _validate_tenant_id(self, tenant_id: str) -> Optional[str]:
-        """Validate tenant ID format"""
-        try:
-            # Ensure it's a valid UUID
-            uuid.UUID(tenant_id)
-            return tenant_id
-        except ValueError:
-            return None
+        """Validate tenant ID format (canonical hyphenated UUID)"""
+        return tenant_id if _UUID_RE.fullmatch(tenant_id) else None
     
     async def _subdomain_to_tenant_id(self, subdomain: str) -> Optional[str]:
         """
@@ -187,18 +207,32 @@ class TenantMiddleware(BaseHTTPMiddleware):
         This would typically involve a database lookup
         For now, we'll use a simple mapping
         """
+        tenant_id = _SUBDOMAIN_CACHE.get(subdomain)
+        if tenant_id is not None:
+            return tenant_id
+        
         if self.tenant_service:
-            return await self.tenant_service.get_tenant_id_by_subdomain(subdomain)
+            tenant_id = await self.tenant_service.get_tenant_id_by_subdomain(subdomain)
+            if tenant_id:
+                _SUBDOMAIN_CACHE[subdomain] = tenant_id
+            return tenant_id
         return None
     
-    async def _extract_tenant_from_token(self, token: str) -> Optional[str]:
-        """Extract tenant ID from JWT token claims"""
+    async def _extract_tenant_from_token(self, token: str, request: Request) -> Optional[str]:
+        """
+        Extract tenant ID from JWT token claims
+        
+        The verified payload is kept on ``request.state.jwt_payload`` so
+        get_current_user does not decode and blacklist-check the token again.
+        """
         try:
             from src.core.security import TokenService
             payload = await TokenService.verify_token(token)
-            return payload.get("tenant_id")
         except Exception:
             return None
+        
+        request.state.jwt_payload = payload
+        return payload.get("tenant_id")
     
     async def _get_tenant_info(self, tenant_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -219,10 +253,88 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 "is_active": True,
                 "plan": "trial",
                 "settings": {},
-                "features": []
+                "features": frozenset()
             }
         
-        return await self.tenant_service.get_tenant_info(tenant_id)
+        tenant_info = _TENANT_INFO_CACHE.get(tenant_id)
+        if tenant_info is not None:
+            return tenant_info
+        
+        tenant_info = await self.tenant_service.get_tenant_info(tenant_id)
+        if tenant_info is None:
+            return None
+        
+        # Features as a set so require_tenant_feature checks are O(1)
+        tenant_info = {**tenant_info, "features": frozenset(tenant_info.get("features") or ())}
+        _TENANT_INFO_CACHE[tenant_id] = tenant_info
+        return tenant_info
+
+
+def add_tenant_context(logger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    structlog processor adding the current tenant to log events
+    
+    Reads the tenant context variables only when an event is actually logged,
+    so requests that do not log pay nothing for tenant log context.
+    """
+    tenant_id = tenant_context.get()
+    if tenant_id:
+        event_dict.setdefault("tenant_id", tenant_id)
+        tenant_info = tenant_info_context.get()
+        if tenant_info:
+            event_dict.setdefault("tenant_name", tenant_info.get("name"))
+            event_dict.setdefault("tenant_plan", tenant_info.get("plan"))
+    return event_dict
+
+
+def invalidate_tenant_info(tenant_id: str) -> None:
+    """
+    Drop a tenant from this process's caches
+    
+    Args:
+        tenant_id: Tenant ID
+    """
+    tenant_info = _TENANT_INFO_CACHE.pop(tenant_id, None)
+    if tenant_info and tenant_info.get("subdomain"):
+        _SUBDOMAIN_CACHE.pop(tenant_info["subdomain"], None)
+
+
+async def listen_for_tenant_invalidations() -> None:
+    """
+    Apply tenant cache invalidations published by any worker
+    
+    Runs for the application lifetime; cancel the task to stop it. Redis
+    failures are logged and the subscription is re-established with
+    exponential backoff. Messages published while disconnected are lost, so
+    the local caches are cleared on every reconnect.
+    """
+    delay = INVALIDATION_RECONNECT_MIN_DELAY
+    while True:
+        client = redis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(TENANT_INVALIDATION_CHANNEL)
+            _TENANT_INFO_CACHE.clear()
+            _SUBDOMAIN_CACHE.clear()
+            delay = INVALIDATION_RECONNECT_MIN_DELAY
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    invalidate_tenant_info(message["data"])
+        except Exception as e:
+            logger.warning(
+                "Tenant invalidation listener disconnected",
+                error=str(e),
+                retry_in=delay
+            )
+        finally:
+            try:
+                await pubsub.aclose()
+                await client.aclose()
+            except Exception:
+                pass
+        
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, INVALIDATION_RECONNECT_MAX_DELAY)
 
 
 def get_current_tenant_id() -> str:
@@ -281,9 +393,8 @@ def require_tenant_feature(feature: str):
     def decorator(func):
         async def wrapper(*args, **kwargs):
             tenant_info = get_current_tenant_info()
-            features = tenant_info.get("features", [])
             
-            if feature not in features:
+            if feature not in tenant_info.get("features", ()):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail={
@@ -306,22 +417,17 @@ def require_tenant_plan(min_plan: str):
     Args:
         min_plan: Minimum required plan (trial, starter, professional, enterprise)
     """
-    PLAN_HIERARCHY = {
-        "trial": 0,
-        "starter": 1, 
-        "professional": 2,
-        "enterprise": 3
-    }
+    try:
+        required_level = PLAN_HIERARCHY[min_plan]
+    except KeyError:
+        raise ValueError(f"Unknown tenant plan: {min_plan}") from None
     
     def decorator(func):
         async def wrapper(*args, **kwargs):
             tenant_info = get_current_tenant_info()
             current_plan = tenant_info.get("plan", "trial")
             
-            current_level = PLAN_HIERARCHY.get(current_plan, 0)
-            required_level = PLAN_HIERARCHY.get(min_plan, 0)
-            
-            if current_level < required_level:
+            if PLAN_HIERARCHY.get(current_plan, 0) < required_level:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail={
@@ -2,23 +2,50 @@
 Database connection and session management for Turkish Business Integration Platform
 """
 
+import asyncio
+import time
+import zlib
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy import event, text
 
 from src.config import settings
 from src.core.tenant import tenant_context
 
-# Create async engine with connection pooling
-engine = create_async_engine(
-    settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_recycle=3600,  # Recycle connections every hour
-    pool_pre_ping=True,  # Verify connections before use
-    echo=settings.debug,  # Log SQL in debug mode
-)
+
+def _create_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """
+    Create an async engine with connection pooling
+    
+    Args:
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections allowed beyond pool_size
+    
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    return create_async_engine(
+        settings.database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=3600,  # Recycle connections every hour
+        pool_pre_ping=True,  # Verify connections before use
+        echo=settings.debug,  # Log SQL in debug mode
+        connect_args={
+            "command_timeout": settings.database_command_timeout,
+            "statement_cache_size": settings.database_statement_cache_size,
+            # Short OLTP queries never amortize JIT compilation
+            "server_settings": {"jit": "off"},
+        },
+    )
+
+
+# Main engine for admin, system and tenant-less sessions
+engine = _create_engine(settings.database_pool_size, settings.database_max_overflow)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -27,9 +54,116 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Admin session factory; sessions are flagged for _apply_admin_role
+AdminSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    info={"admin": True}
+)
+
+# Tenant-affine sub-pools: a tenant always maps to the same shard, so its
+# connections rarely need the tenant binding re-issued. Shard connections are
+# in addition to the main pool; see database_pool_shards for sizing.
+_shard_engines = [
+    _create_engine(settings.database_shard_pool_size, settings.database_shard_max_overflow)
+    for _ in range(settings.database_pool_shards)
+]
+_shard_sessionmakers = [
+    async_sessionmaker(bind=shard, class_=AsyncSession, expire_on_commit=False)
+    for shard in _shard_engines
+]
+
 # Base class for all database models
 Base = declarative_base()
 
+# Health checks trust real traffic this recent instead of querying
+HEALTH_CHECK_MAX_AGE_SECONDS = 5.0
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+# monotonic() of the last session that completed against the database
+_last_ok_ts = 0.0
+
+
+def _mark_database_ok(session: AsyncSession) -> None:
+    """Record a healthy database if the session actually used a connection"""
+    global _last_ok_ts
+    if session.in_transaction():
+        _last_ok_ts = time.monotonic()
+
+
+# Key in the pooled connection's info dict holding the tenant it is bound to
+_TENANT_SCOPE_KEY = "tenant_scope"
+
+_SET_TENANT_SQL = (
+    "SELECT set_config('app.current_tenant', $1, false), "
+    "set_config('role', 'tenant_user', false)"
+)
+_RESET_TENANT_SQL = "RESET app.current_tenant; RESET ROLE"
+_SET_ADMIN_ROLE_SQL = text("SET LOCAL ROLE admin_user")
+
+
+def _bind_tenant(dbapi_connection, connection_record, connection_proxy) -> None:
+    """
+    Bind a pooled connection to the current tenant on checkout
+    
+    The tenant GUC and tenant_user role are session-level, so they survive on
+    the physical connection between checkouts and are only re-issued when the
+    request's tenant differs from the one the connection was last bound to.
+    They are set outside any transaction so a rollback cannot undo them.
+    """
+    tenant_id = tenant_context.get(None)
+    tenant_id = str(tenant_id) if tenant_id else None
+    
+    info = connection_record.info
+    if _TENANT_SCOPE_KEY in info and info[_TENANT_SCOPE_KEY] == tenant_id:
+        return
+    
+    driver = dbapi_connection.driver_connection
+    if tenant_id:
+        dbapi_connection.await_(driver.execute(_SET_TENANT_SQL, tenant_id))
+    else:
+        dbapi_connection.await_(driver.execute(_RESET_TENANT_SQL))
+    info[_TENANT_SCOPE_KEY] = tenant_id
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_admin_role(session, transaction, connection) -> None:
+    """
+    Switch admin sessions to admin_user for the current transaction
+    
+    SET LOCAL reverts on commit/rollback, restoring the connection's cached
+    tenant binding without a RESET round-trip.
+    """
+    if session.info.get("admin"):
+        connection.execute(_SET_ADMIN_ROLE_SQL)
+
+
+for _engine in (engine, *_shard_engines):
+    event.listen(_engine.sync_engine, "checkout", _bind_tenant)
+
+
+def _tenant_sessionmaker(tenant_id) -> async_sessionmaker:
+    """
+    Pick the session factory for a tenant's shard
+    
+    Args:
+        tenant_id: Current tenant, or None outside a tenant request
+    
+    Returns:
+        async_sessionmaker: Shard factory, or the main one without tenant/shards
+    """
+    if not tenant_id or not _shard_sessionmakers:
+        return AsyncSessionLocal
+    shard = zlib.crc32(str(tenant_id).encode()) % len(_shard_sessionmakers)
+    return _shard_sessionmakers[shard]
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections of the main and shard engines"""
+    for pooled_engine in (engine, *_shard_engines):
+        await pooled_engine.dispose()
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -38,30 +172,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Database session with Row-Level Security enabled
     """
-    async with AsyncSessionLocal() as session:
+    async with _tenant_sessionmaker(tenant_context.get(None))() as session:
         try:
-            # Enable Row-Level Security for tenant isolation
-            tenant_id = tenant_context.get(None)
-            if tenant_id:
-                # Set tenant context for RLS policies
-                await session.execute(
-                    text("SET app.current_tenant = :tenant_id"),
-                    {"tenant_id": tenant_id}
-                )
-                # Switch to tenant-restricted role
-                await session.execute(text("SET SESSION ROLE tenant_user"))
-            
+            # Row-Level Security tenant binding is applied by _bind_tenant
+            # when the session checks out its connection
             yield session
+            _mark_database_ok(session)
             
         except Exception:
             await session.rollback()
             raise
         finally:
-            # Reset database role
-            await session.execute(text("RESET ROLE"))
             await session.close()
 
 
+@asynccontextmanager
 async def get_admin_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get database session with admin privileges (bypasses RLS)
@@ -71,16 +196,15 @@ async def get_admin_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Database session with admin privileges
     """
-    async with AsyncSessionLocal() as session:
+    async with AdminSessionLocal() as session:
         try:
-            # Use admin role to bypass RLS
-            await session.execute(text("SET SESSION ROLE admin_user"))
+            # admin_user (bypasses RLS) is applied per transaction by _apply_admin_role
             yield session
+            _mark_database_ok(session)
         except Exception:
             await session.rollback()
             raise
         finally:
-            await session.execute(text("RESET ROLE"))
             await session.close()
 
 
@@ -166,15 +290,44 @@ class DatabaseManager:
         """
         Check database connection health
         
+        Recent successful sessions count as a passing check, so frequent
+        liveness/readiness probes only query when traffic has been idle.
+        
         Returns:
             bool: True if database is healthy
         """
+        global _last_ok_ts
+        if time.monotonic() - _last_ok_ts < HEALTH_CHECK_MAX_AGE_SECONDS:
+            return True
+        
         try:
-            async with AsyncSessionLocal() as session:
-                result = await session.execute(text("SELECT 1"))
-                return result.scalar() == 1
+            # Query asyncpg directly; its per-connection statement cache keeps
+            # the prepared SELECT 1, so repeat probes are just Bind+Execute
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                value = await asyncio.wait_for(
+                    raw.driver_connection.fetchval("SELECT 1"),
+                    timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+                )
+                healthy = value == 1
         except Exception:
             return False
+        
+        if healthy:
+            _last_ok_ts = time.monotonic()
+        return healthy
+    
+    @staticmethod
+    async def warm_pool(size: int = settings.database_pool_min_size) -> None:
+        """
+        Open pooled connections ahead of the first requests
+        
+        Args:
+            size: Number of connections to establish and return to the pool
+        """
+        connections = [await engine.connect() for _ in range(size)]
+        for connection in connections:
+            await connection.close()
     
     @staticmethod
     async def get_database_info() -> dict:
@@ -186,23 +339,14 @@ class DatabaseManager:
         """
         try:
             async with AsyncSessionLocal() as session:
-                # Get PostgreSQL version
-                version_result = await session.execute(text("SELECT version()"))
-                version = version_result.scalar()
-                
-                # Get active connections
-                connections_result = await session.execute(text("""
-                    SELECT count(*) 
-                    FROM pg_stat_activity 
-                    WHERE state = 'active'
-                """))
-                active_connections = connections_result.scalar()
-                
-                # Get database size
-                size_result = await session.execute(text("""
-                    SELECT pg_size_pretty(pg_database_size(current_database()))
+                # Version, active connections and size in one round-trip
+                result = await session.execute(text("""
+                    SELECT
+                        version(),
+                        (SELECT count(*) FROM pg_stat_activity WHERE state = 'active'),
+                        pg_size_pretty(pg_database_size(current_database()))
                 """))
-                database_size = size_result.scalar()
+                version, active_connections, database_size = result.one()
                 
                 return {
                     "version": version,
@@ -7,6 +7,7 @@ import json
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
 from decimal import Decimal
+from types import MappingProxyType
 from urllib.parse import urljoin
 
 import structlog
@@ -35,6 +36,38 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+# DIA web service endpoint per operation
+DIA_ENDPOINTS = MappingProxyType({
+    # Authentication
+    "login": "/SIS/json",
+    "logout": "/SIS/json", 
+    "kontor_sorgula": "/SIS/json",
+    "yetkili_firma_donem": "/SIS/json",
+    
+    # SCF Module
+    "scf_carikart_listele": "/SCF/json",
+    "scf_carikart_getir": "/SCF/json",
+    "scf_carikart_ekle": "/SCF/json",
+    "scf_carikart_guncelle": "/SCF/json",
+    "scf_carikart_sil": "/SCF/json",
+    
+    "scf_stokkart_listele": "/SCF/json",
+    "scf_stokkart_getir": "/SCF/json",
+    "scf_stokkart_ekle": "/SCF/json",
+    "scf_stokkart_guncelle": "/SCF/json",
+    "scf_stokkart_sil": "/SCF/json",
+    
+    "scf_faturafisi_listele": "/SCF/json",
+    "scf_faturafisi_getir": "/SCF/json",
+    "scf_faturafisi_ekle": "/SCF/json",
+    "scf_faturafisi_guncelle": "/SCF/json",
+    "scf_faturafisi_sil": "/SCF/json",
+})
+
+# Shared defaults; built once instead of per connector
+_DEFAULT_MODULE_CONFIG = DIAModuleConfig()
+_CONNECTOR_LOGGER = structlog.get_logger("connector.dia")
+
 
 class DIAConnector(BaseConnector):
     """
@@ -43,45 +76,19 @@ class DIAConnector(BaseConnector):
     Provides integration with DIA ERP system via JSON REST Web Service API
     """
     
+    _endpoints = DIA_ENDPOINTS
+    
     def __init__(self, config: DIAConfig, module_config: Optional[DIAModuleConfig] = None):
         super().__init__(config)
         self.dia_config = config
-        self.module_config = module_config or DIAModuleConfig()
+        self.module_config = module_config or _DEFAULT_MODULE_CONFIG
         
         # Session management
         self._session_id: Optional[str] = None
         self._session_expires_at: Optional[datetime] = None
         self._firma_donem_cache: Dict[str, Any] = {}
         
-        # Module endpoints
-        self._endpoints = {
-            # Authentication
-            "login": "/SIS/json",
-            "logout": "/SIS/json", 
-            "kontor_sorgula": "/SIS/json",
-            "yetkili_firma_donem": "/SIS/json",
-            
-            # SCF Module
-            "scf_carikart_listele": "/SCF/json",
-            "scf_carikart_getir": "/SCF/json",
-            "scf_carikart_ekle": "/SCF/json",
-            "scf_carikart_guncelle": "/SCF/json",
-            "scf_carikart_sil": "/SCF/json",
-            
-            "scf_stokkart_listele": "/SCF/json",
-            "scf_stokkart_getir": "/SCF/json",
-            "scf_stokkart_ekle": "/SCF/json",
-            "scf_stokkart_guncelle": "/SCF/json",
-            "scf_stokkart_sil": "/SCF/json",
-            
-            "scf_faturafisi_listele": "/SCF/json",
-            "scf_faturafisi_getir": "/SCF/json",
-            "scf_faturafisi_ekle": "/SCF/json",
-            "scf_faturafisi_guncelle": "/SCF/json",
-            "scf_faturafisi_sil": "/SCF/json",
-        }
-        
-        self.logger = structlog.get_logger("connector.dia")
+        self.logger = _CONNECTOR_LOGGER
     
     async def authenticate(self) -> bool:
         """
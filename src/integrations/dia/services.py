@@ -3,7 +3,7 @@ DIA ERP Service Layer Implementation
 """
 
 import asyncio
-from typing import Dict, Any, Optional, List, Tuple
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from datetime import datetime, date
 from uuid import UUID
 from decimal import Decimal
@@ -36,6 +36,9 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
+# Rows fetched per server-side cursor round-trip when streaming
+CARI_KART_STREAM_BATCH_SIZE = 500
+
 
 class DIAService:
     """
@@ -243,6 +246,53 @@ class DIAService:
                 message_en="Error during synchronization"
             )
     
+    @staticmethod
+    def _cari_kart_query(
+        tenant_id: UUID,
+        firma_kodu: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build the synced cari kart select for a tenant and optional filters"""
+        query = select(DIACariKartDB).where(
+            DIACariKartDB.tenant_id == tenant_id,
+            DIACariKartDB.sync_status == "synced"
+        )
+        
+        # Add filters
+        if firma_kodu:
+            query = query.where(DIACariKartDB.dia_level1 == firma_kodu)
+        
+        if filters:
+            if "carikarttipi" in filters:
+                query = query.where(DIACariKartDB.carikarttipi == filters["carikarttipi"])
+            if "aktif" in filters:
+                query = query.where(DIACariKartDB.aktif == filters["aktif"])
+            if "search" in filters:
+                search_term = f"%{filters['search']}%"
+                query = query.where(
+                    DIACariKartDB.unvan.ilike(search_term) |
+                    DIACariKartDB.carikartkodu.ilike(search_term)
+                )
+        
+        return query
+    
+    @staticmethod
+    def _cari_kart_to_dict(record: DIACariKartDB) -> Dict[str, Any]:
+        """Convert a cari kart row to its response dict"""
+        return {
+            "id": str(record.id),
+            "dia_key": record.dia_key,
+            "carikartkodu": record.carikartkodu,
+            "unvan": record.unvan,
+            "carikarttipi": record.carikarttipi,
+            "verginumarasi": record.verginumarasi,
+            "vergidairesi": record.vergidairesi,
+            "aktif": record.aktif,
+            "last_sync_at": record.last_sync_at.isoformat() if record.last_sync_at else None,
+            "created_at": record.created_at.isoformat(),
+            "updated_at": record.updated_at.isoformat() if record.updated_at else None
+        }
+    
     async def get_cari_kartlar(
         self,
         tenant_id: UUID,
@@ -256,26 +306,7 @@ class DIAService:
         """
         try:
             async with get_session() as session:
-                query = select(DIACariKartDB).where(
-                    DIACariKartDB.tenant_id == tenant_id,
-                    DIACariKartDB.sync_status == "synced"
-                )
-                
-                # Add filters
-                if firma_kodu:
-                    query = query.where(DIACariKartDB.dia_level1 == firma_kodu)
-                
-                if filters:
-                    if "carikarttipi" in filters:
-                        query = query.where(DIACariKartDB.carikarttipi == filters["carikarttipi"])
-                    if "aktif" in filters:
-                        query = query.where(DIACariKartDB.aktif == filters["aktif"])
-                    if "search" in filters:
-                        search_term = f"%{filters['search']}%"
-                        query = query.where(
-                            DIACariKartDB.unvan.ilike(search_term) |
-                            DIACariKartDB.carikartkodu.ilike(search_term)
-                        )
+                query = self._cari_kart_query(tenant_id, firma_kodu, filters)
                 
                 # Add pagination
                 query = query.offset(offset).limit(limit)
@@ -284,21 +315,7 @@ class DIAService:
                 records = result.scalars().all()
                 
                 # Convert to dict for response
-                data = []
-                for record in records:
-                    data.append({
-                        "id": str(record.id),
-                        "dia_key": record.dia_key,
-                        "carikartkodu": record.carikartkodu,
-                        "unvan": record.unvan,
-                        "carikarttipi": record.carikarttipi,
-                        "verginumarasi": record.verginumarasi,
-                        "vergidairesi": record.vergidairesi,
-                        "aktif": record.aktif,
-                        "last_sync_at": record.last_sync_at.isoformat() if record.last_sync_at else None,
-                        "created_at": record.created_at.isoformat(),
-                        "updated_at": record.updated_at.isoformat() if record.updated_at else None
-                    })
+                data = [self._cari_kart_to_dict(record) for record in records]
                 
                 return ConnectorResponse(
                     success=True,
@@ -322,6 +339,35 @@ class DIAService:
                 message_en="Failed to query cari kartlar"
             )
     
+    async def iter_cari_kartlar(
+        self,
+        tenant_id: UUID,
+        firma_kodu: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = CARI_KART_STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every matching cari kart without materializing the result set
+        
+        Rows are read through a server-side cursor in batches of batch_size.
+        
+        Args:
+            tenant_id: Tenant UUID
+            firma_kodu: Optional firma filter
+            filters: Optional carikarttipi/aktif/search filters
+            batch_size: Rows fetched per cursor round-trip
+            
+        Yields:
+            Dict[str, Any]: Cari kart response dict
+        """
+        query = self._cari_kart_query(tenant_id, firma_kodu, filters).execution_options(
+            yield_per=batch_size
+        )
+        async with get_session() as session:
+            records = await session.stream_scalars(query)
+            async for record in records:
+                yield self._cari_kart_to_dict(record)
+    
     async def create_cari_kart(
         self,
         tenant_id: UUID,
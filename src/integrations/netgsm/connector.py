@@ -4,7 +4,7 @@ Netgsm SMS and WhatsApp connector for Turkish Business Integration Platform
 
 import re
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 
 from pydantic import BaseModel, Field, validator
 import structlog
@@ -13,11 +13,15 @@ from src.integrations.base_connector import (
     BaseConnector, 
     ConnectorConfig, 
     ConnectorResponse,
+    ConnectorError,
     AuthenticationError
 )
 
 logger = structlog.get_logger(__name__)
 
+# Upper bound on report pages fetched by iter_reports (page_size records each)
+REPORT_MAX_PAGES = 200
+
 
 class NetgsmConfig(ConnectorConfig):
     """Netgsm specific configuration"""
@@ -524,6 +528,107 @@ class NetgsmConnector(BaseConnector):
                 message_en="Delivery report error"
             )
     
+    async def iter_reports(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        message_type: Optional[str] = None,
+        page_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate delivery reports page by page
+        
+        Relies on /sms/report/list honouring ``page`` (1-based) and ``pagesize``
+        and answering a page past the end with an empty or short list. Because
+        an endpoint that ignores these parameters would return the same full
+        list for every page, iteration also stops when a page repeats the
+        previous one, and after REPORT_MAX_PAGES pages.
+        
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            message_type: Report type filter (sms/whatsapp)
+            page_size: Records requested per page
+            
+        Yields:
+            List[Dict[str, Any]]: One page of report records
+            
+        Raises:
+            ConnectorError: If a page cannot be retrieved
+        """
+        previous: Optional[List[Dict[str, Any]]] = None
+        for page in range(1, REPORT_MAX_PAGES + 1):
+            params = {
+                "usercode": self.config.user_code,
+                "password": self.config.password,
+                "page": page,
+                "pagesize": page_size
+            }
+            if start_date:
+                params["startdate"] = start_date
+            if end_date:
+                params["stopdate"] = end_date
+            if message_type:
+                params["type"] = message_type
+            
+            response = await self._make_request(
+                method="GET",
+                endpoint="/sms/report/list",
+                params=params
+            )
+            
+            if not response.success:
+                raise ConnectorError(
+                    message=response.error or "Rapor alınamadı",
+                    error_code=response.error_code or "REPORT_ERROR",
+                    status_code=response.status_code
+                )
+            
+            data = response.data
+            records = data if isinstance(data, list) else (data or {}).get("reports", [])
+            if not records:
+                return
+            if records == previous:
+                self.logger.warning("Report paging ignored, page repeated", page=page)
+                return
+            
+            yield records
+            
+            if len(records) < page_size:
+                return
+            previous = records
+        
+        self.logger.warning("Report paging stopped at page limit", max_pages=REPORT_MAX_PAGES)
+    
+    async def get_reports(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        message_type: Optional[str] = None
+    ) -> ConnectorResponse:
+        """Get all delivery reports for the given range"""
+        try:
+            reports: List[Dict[str, Any]] = []
+            async for page in self.iter_reports(start_date, end_date, message_type):
+                reports.extend(page)
+            
+            return ConnectorResponse(
+                success=True,
+                data=reports,
+                message_tr="Raporlar alındı",
+                message_en="Reports retrieved"
+            )
+            
+        except ConnectorError as e:
+            return ConnectorResponse(
+                success=False,
+                status_code=e.status_code,
+                error=e.message,
+                error_code=e.error_code,
+                message_tr="Rapor alma hatası",
+                message_en="Report retrieval error"
+            )
+    
     async def validate_phone(self, phone: str) -> ConnectorResponse:
         """Validate Turkish phone number format"""
         try:
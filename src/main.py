@@ -3,36 +3,82 @@ Turkish Business Integration Platform - FastAPI Application
 """
 
 import asyncio
+import logging
+import logging.handlers
+import queue
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
 import structlog
 
 from src.config import settings
-from src.database import engine, setup_row_level_security, DatabaseManager
-from src.core.tenant import TenantMiddleware
+from src.database import dispose_engines, setup_row_level_security, DatabaseManager
+from src.core.tenant import TenantMiddleware, add_tenant_context, listen_for_tenant_invalidations
+from src.services.webhook_dispatcher import webhook_dispatcher
 from src.api.v1 import auth, tenants, integrations, webhooks, health, dia
-from src.utils.monitoring import setup_monitoring, MetricsMiddleware
+from src.utils.monitoring import setup_monitoring, sample_cpu_usage, MetricsMiddleware
 from src.utils.turkish import setup_turkish_localization
 
-# Configure structured logging
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records untouched
+    
+    The stock handler formats each record before enqueueing, which would run
+    JSON rendering on the caller's thread and stringify structlog event dicts.
+    The queue is in-process, so records can be handed over as-is.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Log records are handed to a queue and rendered/written to stderr by a
+# listener thread, so formatting and handler I/O never run on the event loop
+log_handler = logging.StreamHandler(sys.stderr)
+log_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+    # Plain stdlib records (e.g. logging.getLogger(...) with extra=)
+    foreign_pre_chain=[
+        structlog.processors.TimeStamper(fmt="ISO"),
+        structlog.processors.add_log_level,
+        structlog.stdlib.ExtraAdder(),
+    ],
+    processors=[
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        structlog.processors.JSONRenderer(),
+    ],
+))
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    log_handler,
+    respect_handler_level=True
+)
+root_logger = logging.getLogger()
+root_logger.addHandler(_PassThroughQueueHandler(log_queue))
+root_logger.setLevel(settings.log_level.upper())
+log_listener.start()
+
+# Configure structured logging; rendering happens in the listener thread
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
+        add_tenant_context,
         structlog.processors.TimeStamper(fmt="ISO"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer()
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ],
     wrapper_class=structlog.make_filtering_bound_logger(
         min_level=getattr(structlog.stdlib, settings.log_level.upper())
     ),
     context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
@@ -59,6 +105,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             logger.error("❌ Database connection failed")
             raise Exception("Database connection failed")
         
+        # Open warm connections so early requests skip TCP/TLS setup
+        await DatabaseManager.warm_pool()
+        logger.info(
+            "✅ Database pool warmed",
+            connections=settings.database_pool_min_size
+        )
+        
         # Setup Row-Level Security for multi-tenant isolation
         if settings.is_production:
             await setup_row_level_security()
@@ -69,6 +122,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             setup_monitoring()
             logger.info("✅ Monitoring configured")
         
+        # Start outbound webhook delivery workers
+        await webhook_dispatcher.start()
+        app.state.http = webhook_dispatcher.client
+        logger.info("✅ Webhook dispatcher started")
+        
+        # Keep per-process tenant caches in sync across workers
+        tenant_invalidation_task = asyncio.create_task(
+            listen_for_tenant_invalidations(), name="tenant-cache-invalidation"
+        )
+        logger.info("✅ Tenant cache invalidation listener started")
+        
+        # Sample CPU usage off the request path for health endpoints
+        cpu_sampler_task = asyncio.create_task(sample_cpu_usage(), name="cpu-sampler")
+        
         # Setup Turkish localization
         setup_turkish_localization()
         logger.info("✅ Turkish localization configured")
@@ -85,14 +152,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("Shutting down Turkish Business Integration Platform...")
     
     try:
+        # Stop tenant cache invalidation listener
+        tenant_invalidation_task.cancel()
+        cpu_sampler_task.cancel()
+        await asyncio.gather(tenant_invalidation_task, cpu_sampler_task, return_exceptions=True)
+        
+        # Finish queued webhook deliveries
+        await webhook_dispatcher.stop()
+        logger.info("✅ Webhook dispatcher stopped")
+        
         # Close database connections
-        await engine.dispose()
+        await dispose_engines()
         logger.info("✅ Database connections closed")
         
         logger.info("👋 Application shutdown completed")
         
     except Exception as e:
         logger.error("❌ Error during shutdown", error=str(e))
+    finally:
+        # Drain queued log records before the process exits
+        log_listener.stop()
 
 
 # Create FastAPI application
@@ -103,7 +182,8 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     openapi_url="/openapi.json" if settings.debug else None,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add security headers middleware
@@ -154,7 +234,7 @@ app.add_middleware(TenantMiddleware)
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Handle 404 errors with Turkish localization"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "not_found",
@@ -174,7 +254,7 @@ async def internal_error_handler(request: Request, exc):
         error=str(exc)
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "internal_error",
@@ -300,13 +380,13 @@ async def simple_health():
         if database_healthy:
             return {"status": "healthy"}
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"status": "unhealthy", "reason": "database_unavailable"}
             )
     except Exception as e:
         logger.error("Health check failed", error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unhealthy", "reason": "service_error"}
         )
@@ -319,7 +399,7 @@ async def readiness_check():
         database_healthy = await DatabaseManager.health_check()
         
         if not database_healthy:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "status": "not_ready",
@@ -330,7 +410,7 @@ async def readiness_check():
         return {"status": "ready"}
     except Exception as e:
         logger.error("Readiness check failed", error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "not_ready",
@@ -346,6 +426,9 @@ if __name__ == "__main__":
         "src.main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.debug else settings.worker_count,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
         access_log=settings.debug
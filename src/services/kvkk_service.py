@@ -9,10 +9,12 @@ This service provides KVKK (Turkish Data Protection Law) compliance features:
 - Data retention management
 """
 
+import asyncio
 import json
+from contextlib import AsyncExitStack
 import zipfile
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from pathlib import Path
 import uuid
 import tempfile
@@ -21,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, text
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel, Field, validator
+import orjson
 import structlog
 
 from src.database import get_session
@@ -30,6 +33,9 @@ from src.core.security import get_current_user
 
 logger = structlog.get_logger(__name__)
 
+# Rows fetched up front (and per cursor round-trip) for streamed exports
+EXPORT_STREAM_BATCH_SIZE = 500
+
 
 class ConsentRequest(BaseModel):
     """Request to record user consent"""
@@ -367,36 +373,15 @@ class KVKKService:
                     # Create export file
                     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
                     
-                    if export_request.export_format == "json":
-                        export_file = export_dir / f"data_export_{timestamp}.json"
-                        with open(export_file, 'w', encoding='utf-8') as f:
-                            json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
-                    
-                    elif export_request.export_format == "csv":
-                        # Create separate CSV files for each table
-                        import csv
-                        csv_files = []
-                        
-                        for table_name, records in export_data.items():
-                            if records:
-                                csv_file = export_dir / f"{table_name}_{timestamp}.csv"
-                                csv_files.append(csv_file)
-                                
-                                with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                                    if records:
-                                        writer = csv.DictWriter(f, fieldnames=records[0].keys())
-                                        writer.writeheader()
-                                        writer.writerows(records)
-                        
-                        export_file = export_dir / f"data_export_{timestamp}.csv"
-                    
-                    # Create ZIP archive
-                    zip_file = Path(temp_dir) / f"kvkk_export_{timestamp}.zip"
-                    
-                    with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        for file in export_dir.rglob("*"):
-                            if file.is_file():
-                                zf.write(file, file.relative_to(export_dir))
+                    # File writing and zipping are blocking; keep them off the event loop
+                    zip_file = await asyncio.to_thread(
+                        self._write_export_archive,
+                        Path(temp_dir),
+                        export_dir,
+                        export_data,
+                        export_request.export_format,
+                        timestamp
+                    )
                     
                     # Log export
                     await self._log_audit_event(
@@ -438,6 +423,129 @@ class KVKKService:
                 "message_en": f"Data export failed: {str(e)}"
             }
     
+    async def stream_user_data(
+        self,
+        tenant_id: uuid.UUID,
+        export_request: DataExportRequest
+    ) -> AsyncIterator[bytes]:
+        """
+        Prepare a streamed JSON export of user data (KVKK right to portability)
+        
+        The DATA_EXPORT audit record is committed and the first batch of rows
+        is fetched before this returns, so the disclosure is always audited
+        and database errors surface to the caller instead of mid-response.
+        Rows are then read with server-side cursors and encoded one at a time,
+        so memory stays flat regardless of export size. Output shape is
+        ``{"tables": {"<table>": [row, ...], ...}}``.
+        
+        Args:
+            tenant_id: Tenant ID
+            export_request: Export parameters
+            
+        Returns:
+            AsyncIterator[bytes]: JSON document chunks
+        """
+        queries = []
+        for model_class in self._get_tenant_aware_models():
+            query = select(model_class).where(
+                model_class.tenant_id == tenant_id,
+                model_class.data_subject_id == export_request.data_subject_id
+            )
+            if export_request.date_from:
+                query = query.where(model_class.created_at >= export_request.date_from)
+            if export_request.date_to:
+                query = query.where(model_class.created_at <= export_request.date_to)
+            queries.append((model_class.__tablename__, query))
+        
+        queries.append(("consent_records", select(ConsentRecord).where(
+            ConsentRecord.tenant_id == tenant_id,
+            ConsentRecord.data_subject_id == export_request.data_subject_id
+        )))
+        
+        if export_request.include_audit_logs:
+            queries.append(("audit_logs", select(AuditLogModel).where(
+                AuditLogModel.tenant_id == tenant_id,
+                AuditLogModel.data_subject_id == export_request.data_subject_id
+            )))
+        
+        stack = AsyncExitStack()
+        try:
+            session = await stack.enter_async_context(get_session())
+            
+            await self._log_audit_event(
+                session=session,
+                tenant_id=tenant_id,
+                event_type="DATA_EXPORT",
+                table_name="multiple",
+                data_subject_id=export_request.data_subject_id,
+                processing_purpose="data_portability"
+            )
+            await session.commit()
+            
+            first_rows = await session.stream_scalars(queries[0][1])
+            first_batch = await first_rows.fetchmany(EXPORT_STREAM_BATCH_SIZE)
+        except BaseException:
+            await stack.aclose()
+            raise
+        
+        return self._export_chunks(
+            stack, session, queries, first_rows, first_batch, tenant_id, export_request
+        )
+    
+    async def _export_chunks(
+        self,
+        stack: AsyncExitStack,
+        session: AsyncSession,
+        queries: List[tuple],
+        first_rows: Any,
+        first_batch: List[Any],
+        tenant_id: uuid.UUID,
+        export_request: DataExportRequest
+    ) -> AsyncIterator[bytes]:
+        """Encode the prepared export queries as one JSON document"""
+        async with stack:
+            try:
+                yield b'{"tables":{'
+                
+                for index, (table_name, query) in enumerate(queries):
+                    yield (b"," if index else b"") + orjson.dumps(table_name) + b":["
+                    
+                    if index:
+                        rows = await session.stream_scalars(query)
+                        batch = []
+                    else:
+                        rows, batch = first_rows, first_batch
+                    
+                    first = True
+                    for record in batch:
+                        row = orjson.dumps(self._sanitize_export_data(record.to_dict()), default=str)
+                        yield row if first else b"," + row
+                        first = False
+                    async for record in rows:
+                        row = orjson.dumps(self._sanitize_export_data(record.to_dict()), default=str)
+                        yield row if first else b"," + row
+                        first = False
+                    
+                    yield b"]"
+                
+                yield b"}}"
+            except Exception as e:
+                # Headers are already sent; the document is left unterminated
+                # so clients cannot mistake it for a complete export
+                self.logger.error(
+                    "Data export stream failed",
+                    tenant_id=str(tenant_id),
+                    data_subject_id=str(export_request.data_subject_id),
+                    error=str(e)
+                )
+                raise
+        
+        self.logger.info(
+            "Data export streamed",
+            tenant_id=str(tenant_id),
+            data_subject_id=str(export_request.data_subject_id)
+        )
+    
     async def anonymize_user_data(
         self,
         tenant_id: uuid.UUID,
@@ -730,6 +838,55 @@ class KVKKService:
         
         session.add(audit_log)
     
+    def _write_export_archive(
+        self,
+        temp_dir: Path,
+        export_dir: Path,
+        export_data: Dict[str, List[Dict[str, Any]]],
+        export_format: str,
+        timestamp: str
+    ) -> Path:
+        """
+        Write export files and pack them into a ZIP archive
+        
+        Runs in a worker thread since all file IO here is blocking.
+        
+        Returns:
+            Path: Created ZIP archive
+        """
+        if export_format == "json":
+            export_file = export_dir / f"data_export_{timestamp}.json"
+            with open(export_file, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+        
+        elif export_format == "csv":
+            # Create separate CSV files for each table
+            import csv
+            csv_files = []
+            
+            for table_name, records in export_data.items():
+                if records:
+                    csv_file = export_dir / f"{table_name}_{timestamp}.csv"
+                    csv_files.append(csv_file)
+                    
+                    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+                        if records:
+                            writer = csv.DictWriter(f, fieldnames=records[0].keys())
+                            writer.writeheader()
+                            writer.writerows(records)
+            
+            export_file = export_dir / f"data_export_{timestamp}.csv"
+        
+        # Create ZIP archive
+        zip_file = temp_dir / f"kvkk_export_{timestamp}.zip"
+        
+        with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for file in export_dir.rglob("*"):
+                if file.is_file():
+                    zf.write(file, file.relative_to(export_dir))
+        
+        return zip_file
+    
     def _get_tenant_aware_models(self):
         """Get all models that inherit from TenantAwareModel"""
         # This would return all registered models that inherit from TenantAwareModel
@@ -10,16 +10,61 @@ import re
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, and_, or_
 from sqlalchemy.exc import IntegrityError
+import httpx
+import orjson
+import redis.asyncio as redis
 import structlog
 
+from src.config import settings
 from src.models.tenant import Tenant, TenantPlan, TenantStatus
 from src.models.base import AuditLogModel
 from src.database import get_admin_db
 from src.core.security import TokenService
+from src.core.tenant import TENANT_INVALIDATION_CHANNEL
+from src.services.webhook_signer import get_webhook_signer
 from src.utils.turkish import format_turkish_currency
 
 logger = structlog.get_logger(__name__)
 
+# Redis client for cached tenant snapshots (raw orjson bytes)
+redis_client = redis.from_url(settings.redis_url)
+
+TENANT_CACHE_KEY = "tenant:info:{tenant_id}"  # Projection only; see TENANT_INFO_FIELDS
+TENANT_CACHE_TTL = 300
+
+# Tenant fields cached for the middleware; tax, billing, contact, usage and
+# secret columns never enter the shared cache
+TENANT_INFO_FIELDS = (
+    "id",
+    "name",
+    "subdomain",
+    "domain",
+    "country",
+    "plan",
+    "status",
+    "plan_limits",
+    "features",
+    "language",
+    "timezone",
+    "currency",
+    "date_format",
+    "time_format",
+    "is_active",
+    "is_trial",
+    "is_verified",
+    "trial_ends_at",
+    "subscription_start",
+    "subscription_end",
+    "onboarding_completed",
+    "onboarding_step",
+    "support_tier",
+    "created_at",
+    "updated_at",
+    "is_trial_expired",
+    "is_subscription_active",
+    "plan_features",
+)
+
 
 class TenantServiceError(Exception):
     """Base tenant service exception"""
@@ -41,6 +86,11 @@ class TenantQuotaExceededError(TenantServiceError):
     pass
 
 
+class WebhookDeliveryError(TenantServiceError):
+    """Webhook receiver failed in a way worth retrying"""
+    pass
+
+
 class TenantService:
     """
     Tenant management service for multi-tenant SaaS platform
@@ -212,16 +262,66 @@ class TenantService:
         """
         Get tenant info for middleware context
         
+        Only the TENANT_INFO_FIELDS projection is cached. Redis failures are
+        treated as a cache miss, so the middleware keeps working from the DB.
+        
         Args:
             tenant_id: Tenant UUID
             
         Returns:
-            Optional[Dict[str, Any]]: Tenant info or None
+            Optional[Dict[str, Any]]: Tenant info projection or None
         """
+        cache_key = TENANT_CACHE_KEY.format(tenant_id=tenant_id)
         try:
-            return await self.get_tenant(tenant_id)
-        except TenantNotFoundError:
+            cached = await redis_client.get(cache_key)
+        except redis.RedisError as e:
+            self.logger.warning("Tenant cache read failed", tenant_id=str(tenant_id), error=str(e))
+            cached = None
+        if cached is not None:
+            return orjson.loads(cached)
+        
+        result = await self.get_tenant_by_id(tenant_id)
+        if not result["success"]:
             return None
+        
+        tenant_info = {field: result["tenant"].get(field) for field in TENANT_INFO_FIELDS}
+        try:
+            await redis_client.setex(cache_key, TENANT_CACHE_TTL, orjson.dumps(tenant_info))
+        except redis.RedisError as e:
+            self.logger.warning("Tenant cache write failed", tenant_id=str(tenant_id), error=str(e))
+        
+        return tenant_info
+    
+    async def get_tenant_by_id(self, tenant_id: str) -> Dict[str, Any]:
+        """
+        Get tenant by ID in endpoint result format
+        
+        Returns the full tenant record (secrets filtered by Tenant.to_dict),
+        read from the database.
+        
+        Args:
+            tenant_id: Tenant UUID
+            
+        Returns:
+            Dict[str, Any]: Result with success flag and tenant data
+        """
+        async with get_admin_db() as db:
+            result = await db.execute(
+                select(Tenant).where(Tenant.id == tenant_id)
+            )
+            tenant = result.scalar_one_or_none()
+            
+            if not tenant:
+                return {
+                    "success": False,
+                    "message": f"Tenant bulunamadı: {tenant_id}",
+                    "message_en": f"Tenant not found: {tenant_id}"
+                }
+            
+            return {
+                "success": True,
+                "tenant": tenant.to_dict()
+            }
     
     async def update_tenant(
         self,
@@ -282,6 +382,7 @@ class TenantService:
             
             await db.commit()
             await db.refresh(tenant)
+            await self._invalidate_tenant_cache(tenant_id)
             
             # Log update
             await self._log_tenant_event(
@@ -339,6 +440,7 @@ class TenantService:
             
             await db.commit()
             await db.refresh(tenant)
+            await self._invalidate_tenant_cache(tenant_id)
             
             # Log plan upgrade
             await self._log_tenant_event(
@@ -390,6 +492,7 @@ class TenantService:
             
             await db.commit()
             await db.refresh(tenant)
+            await self._invalidate_tenant_cache(tenant_id)
             
             # Log trial extension
             await self._log_tenant_event(
@@ -442,6 +545,7 @@ class TenantService:
             )
             
             await db.commit()
+            await self._invalidate_tenant_cache(tenant_id)
             
             self.logger.warning(
                 "Tenant suspended",
@@ -483,6 +587,8 @@ class TenantService:
             
             tenant.current_usage = current_usage
             
+            # Usage is not part of the cached TENANT_INFO_FIELDS snapshot, so
+            # counter bumps leave the tenant caches alone
             await db.commit()
             
             return current_usage
@@ -499,20 +605,7 @@ class TenantService:
             Dict[str, Any]: Quota information
         """
         tenant = await self.get_tenant(tenant_id)
-        
-        limit = tenant["plan_limits"].get(resource, 0)
-        used = tenant["current_usage"].get(resource, 0)
-        remaining = max(0, limit - used)
-        
-        return {
-            "resource": resource,
-            "limit": limit,
-            "used": used,
-            "remaining": remaining,
-            "percentage_used": (used / max(limit, 1)) * 100,
-            "quota_exceeded": used >= limit,
-            "plan": tenant["plan"]
-        }
+        return self._quota_status(tenant, resource)
     
     async def get_tenant_stats(self, tenant_id: str) -> Dict[str, Any]:
         """
@@ -526,10 +619,11 @@ class TenantService:
         """
         tenant = await self.get_tenant(tenant_id)
         
-        # Calculate quota status for all resources
-        quotas = {}
-        for resource in tenant["plan_limits"]:
-            quotas[resource] = await self.check_quota(tenant_id, resource)
+        # Calculate quota status for all resources from the already loaded tenant
+        quotas = {
+            resource: self._quota_status(tenant, resource)
+            for resource in tenant["plan_limits"]
+        }
         
         # Calculate subscription info
         subscription_info = {
@@ -568,6 +662,110 @@ class TenantService:
             "onboarding_completed": tenant.get("onboarding_completed", False)
         }
     
+    async def send_webhook(
+        self,
+        client: httpx.AsyncClient,
+        tenant_id: str,
+        webhook_id: str,
+        payload: Dict[str, Any],
+        delivery_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Deliver one webhook payload to its endpoint
+        
+        The endpoint URL and secret are loaded here, so the secret never
+        travels through request handlers, the delivery queue or the broker.
+        The body is signed with the secret (HMAC-SHA256, hex) in the
+        X-Signature header. Transport errors, 429 and 5xx responses raise so
+        the dispatcher or Celery can retry; other 4xx responses are final.
+        
+        Args:
+            client: Shared pooled HTTP client
+            tenant_id: Tenant UUID
+            webhook_id: Webhook ID
+            payload: Event payload
+            delivery_id: Delivery being retried, if any
+            
+        Returns:
+            Dict[str, Any]: Delivery result with success flag and status code
+            
+        Raises:
+            WebhookDeliveryError: If the receiver answered 429 or 5xx
+            httpx.HTTPError: If the request could not be sent
+        """
+        webhook_result = await self.get_webhook_by_id(tenant_id, webhook_id)
+        if not webhook_result["success"]:
+            self.logger.warning(
+                "Webhook delivery skipped, webhook not found",
+                tenant_id=str(tenant_id),
+                webhook_id=str(webhook_id),
+                delivery_id=delivery_id
+            )
+            return {
+                "success": False,
+                "status_code": None
+            }
+        
+        webhook = webhook_result["webhook"]
+        url = webhook["url"]
+        secret = webhook.get("secret")
+        
+        body = orjson.dumps(payload)
+        headers = {
+            "Content-Type": "application/json",
+            "X-Webhook-ID": str(webhook_id),
+            "X-Webhook-Event": str(payload.get("event", ""))
+        }
+        if delivery_id:
+            headers["X-Webhook-Delivery"] = str(delivery_id)
+        if secret:
+            headers["X-Signature"] = get_webhook_signer(secret).sign(body)
+        
+        response = await client.post(url, content=body, headers=headers)
+        
+        if response.status_code == 429 or response.status_code >= 500:
+            raise WebhookDeliveryError(
+                f"Webhook receiver answered {response.status_code}"
+            )
+        
+        success = response.is_success
+        log = self.logger.info if success else self.logger.warning
+        log(
+            "Webhook delivered" if success else "Webhook rejected",
+            webhook_id=str(webhook_id),
+            delivery_id=delivery_id,
+            status_code=response.status_code
+        )
+        
+        return {
+            "success": success,
+            "status_code": response.status_code
+        }
+    
+    async def _invalidate_tenant_cache(self, tenant_id: str) -> None:
+        """Drop the cached tenant snapshot after a write and notify all workers"""
+        try:
+            await redis_client.delete(TENANT_CACHE_KEY.format(tenant_id=tenant_id))
+            await redis_client.publish(TENANT_INVALIDATION_CHANNEL, str(tenant_id))
+        except redis.RedisError as e:
+            self.logger.warning("Tenant cache invalidation failed", tenant_id=str(tenant_id), error=str(e))
+    
+    def _quota_status(self, tenant: Dict[str, Any], resource: str) -> Dict[str, Any]:
+        """Build quota information for resource from loaded tenant data"""
+        limit = tenant["plan_limits"].get(resource, 0)
+        used = tenant["current_usage"].get(resource, 0)
+        remaining = max(0, limit - used)
+        
+        return {
+            "resource": resource,
+            "limit": limit,
+            "used": used,
+            "remaining": remaining,
+            "percentage_used": (used / max(limit, 1)) * 100,
+            "quota_exceeded": used >= limit,
+            "plan": tenant["plan"]
+        }
+    
     def _validate_subdomain(self, subdomain: str) -> bool:
         """Validate subdomain format"""
         if not subdomain or len(subdomain) < 3 or len(subdomain) > 63:
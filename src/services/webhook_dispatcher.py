@@ -0,0 +1,239 @@
+"""
+Webhook delivery dispatcher for Turkish Business Integration Platform
+
+Outbound webhook deliveries are queued and sent by a fixed pool of worker
+tasks started with the application, so in-flight deliveries are bounded and
+request handlers only enqueue. All workers share one pooled HTTP/2 client.
+
+With ``webhook_use_celery`` enabled, deliveries are published to the Celery
+``webhooks`` queue instead and run in separate worker processes.
+"""
+
+import asyncio
+import random
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+import structlog
+
+from src.config import settings
+from src.services.tenant_service import tenant_service
+
+logger = structlog.get_logger(__name__)
+
+
+class WebhookQueueFullError(Exception):
+    """Webhook delivery queue is at capacity"""
+    pass
+
+
+class WebhookDispatcher:
+    """
+    Bounded asyncio queue drained by N delivery workers
+    
+    Handles:
+    - Queueing deliveries from request handlers without blocking
+    - Capping concurrent deliveries at the worker count
+    - Draining queued deliveries on shutdown
+    - Reusing keep-alive HTTP/2 connections across deliveries
+    """
+    
+    def __init__(self):
+        self.logger = logger.bind(service="webhook_dispatcher")
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self.client: Optional[httpx.AsyncClient] = None
+        self._priming: Set[asyncio.Task] = set()
+    
+    async def start(
+        self,
+        worker_count: int = settings.webhook_worker_count,
+        maxsize: int = settings.webhook_queue_maxsize
+    ) -> None:
+        """
+        Create the queue and launch delivery workers
+        
+        Nothing is started when deliveries go through Celery.
+        
+        Args:
+            worker_count: Number of concurrent delivery workers
+            maxsize: Maximum number of queued deliveries
+        """
+        if settings.webhook_use_celery:
+            self.logger.info("Webhook deliveries routed to Celery")
+            return
+        
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(settings.request_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.webhook_http_max_connections,
+                max_keepalive_connections=settings.webhook_http_max_keepalive
+            )
+        )
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"webhook-worker-{index}")
+            for index in range(worker_count)
+        ]
+        self.logger.info("Webhook dispatcher started", workers=worker_count, maxsize=maxsize)
+    
+    async def stop(self) -> None:
+        """Wait for queued deliveries to finish, then cancel workers and close the client"""
+        if self._queue is None:
+            return
+        
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        
+        await self.client.aclose()
+        
+        self._workers = []
+        self._queue = None
+        self.client = None
+    
+    async def enqueue(self, **delivery: Any) -> None:
+        """
+        Queue a webhook delivery for tenant_service.send_webhook
+        
+        Args:
+            **delivery: Keyword arguments for tenant_service.send_webhook
+        
+        Raises:
+            WebhookQueueFullError: If the queue is full or not started
+        """
+        if settings.webhook_use_celery:
+            await self._publish(delivery)
+            return
+        
+        self._put(delivery)
+    
+    def _put(self, delivery: Dict[str, Any]) -> None:
+        """Put a delivery on the in-process queue without waiting"""
+        if self._queue is None:
+            raise WebhookQueueFullError("Webhook dispatcher is not running")
+        
+        try:
+            self._queue.put_nowait(delivery)
+        except asyncio.QueueFull:
+            raise WebhookQueueFullError("Webhook delivery queue is full")
+    
+    async def schedule_retry(self, attempt: int, **delivery: Any) -> float:
+        """
+        Queue a delivery retry after a full-jitter exponential backoff
+        
+        The delay is drawn uniformly from [0, min(cap, base * 2 ** (attempt - 1))]
+        so retries of deliveries that failed together do not arrive together.
+        
+        Args:
+            attempt: Retry attempt number, starting at 1
+            **delivery: Keyword arguments for tenant_service.send_webhook
+            
+        Returns:
+            float: Delay in seconds before the retry is queued
+            
+        Raises:
+            WebhookQueueFullError: If the dispatcher is not started
+        """
+        if self._queue is None and not settings.webhook_use_celery:
+            raise WebhookQueueFullError("Webhook dispatcher is not running")
+        
+        ceiling_ms = min(
+            settings.webhook_retry_cap_ms,
+            settings.webhook_retry_base_ms * 2 ** max(attempt - 1, 0)
+        )
+        delay = random.uniform(0, ceiling_ms) / 1000.0
+        
+        if settings.webhook_use_celery:
+            await self._publish(delivery, countdown=delay)
+        else:
+            asyncio.get_running_loop().call_later(delay, self._enqueue_delayed, delivery)
+        return delay
+    
+    def prime_connection(self, url: str) -> None:
+        """
+        Open a pooled connection to a webhook endpoint in the background
+        
+        DNS resolution and the TLS handshake happen now instead of on the first
+        delivery. Failures are only logged; the endpoint may come up later.
+        
+        Args:
+            url: Webhook endpoint URL
+        """
+        if self.client is None:
+            return
+        
+        task = asyncio.create_task(self._prime(url))
+        self._priming.add(task)
+        task.add_done_callback(self._priming.discard)
+    
+    async def _prime(self, url: str) -> None:
+        """Send a HEAD request through the shared client to warm its pool"""
+        try:
+            await self.client.head(url)
+        except httpx.HTTPError as e:
+            self.logger.info("Webhook endpoint not reachable yet", url=url, error=str(e))
+    
+    async def _publish(self, delivery: Dict[str, Any], countdown: Optional[float] = None) -> None:
+        """
+        Publish a delivery to the Celery webhooks queue
+        
+        The blocking kombu publish runs in a worker thread without connection
+        retries, so an unreachable broker fails fast instead of stalling the
+        event loop.
+        
+        Args:
+            delivery: Keyword arguments for tenant_service.send_webhook
+            countdown: Seconds to wait before the task may run
+            
+        Raises:
+            WebhookQueueFullError: If the broker cannot accept the task
+        """
+        from src.tasks.webhooks import send_webhook_task
+        
+        try:
+            await asyncio.to_thread(
+                send_webhook_task.apply_async,
+                kwargs=delivery,
+                countdown=countdown,
+                retry=False
+            )
+        except Exception as e:
+            self.logger.error(
+                "Webhook publish failed",
+                webhook_id=str(delivery.get("webhook_id")),
+                error=str(e)
+            )
+            raise WebhookQueueFullError("Webhook broker is unavailable") from e
+    
+    def _enqueue_delayed(self, delivery: Dict[str, Any]) -> None:
+        """Put a backed-off retry on the queue, dropping it if full or stopped"""
+        try:
+            self._put(delivery)
+        except WebhookQueueFullError as e:
+            self.logger.warning(
+                "Webhook retry dropped",
+                webhook_id=str(delivery.get("webhook_id")),
+                reason=str(e)
+            )
+    
+    async def _worker(self) -> None:
+        """Deliver queued webhooks one at a time"""
+        while True:
+            delivery: Dict[str, Any] = await self._queue.get()
+            try:
+                await tenant_service.send_webhook(client=self.client, **delivery)
+            except Exception as e:
+                self.logger.error(
+                    "Webhook delivery failed",
+                    webhook_id=str(delivery.get("webhook_id")),
+                    error=str(e)
+                )
+            finally:
+                self._queue.task_done()
+
+
+# Service instance
+webhook_dispatcher = WebhookDispatcher()
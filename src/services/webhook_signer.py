@@ -0,0 +1,60 @@
+"""
+Outbound webhook payload signing for Turkish Business Integration Platform
+"""
+
+import hashlib
+import hmac
+from functools import lru_cache
+
+# Signers kept for recently delivered-to webhooks
+WEBHOOK_SIGNER_CACHE_SIZE = 256
+
+
+class WebhookSigner:
+    """
+    HMAC-SHA256 signer for outbound webhook payloads
+    
+    The keyed HMAC state (inner/outer pad blocks already absorbed) is built once
+    per secret; each signature copies that state, so signing only hashes the
+    payload itself through OpenSSL.
+    """
+    
+    __slots__ = ("_keyed",)
+    
+    def __init__(self, secret: str):
+        self._keyed = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    
+    def sign(self, payload: bytes) -> str:
+        """
+        Sign payload bytes
+        
+        Args:
+            payload: Exact request body that will be delivered
+            
+        Returns:
+            str: Hex encoded HMAC-SHA256 signature
+        """
+        mac = self._keyed.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+    
+    def verify(self, payload: bytes, signature: str) -> bool:
+        """Constant-time check of a hex signature against payload"""
+        return hmac.compare_digest(self.sign(payload), signature)
+
+
+@lru_cache(maxsize=WEBHOOK_SIGNER_CACHE_SIZE)
+def get_webhook_signer(secret: str) -> WebhookSigner:
+    """
+    Get the cached signer for a webhook secret
+    
+    Only secrets used by actual deliveries enter the cache, and the bound
+    keeps rotated-out secrets from accumulating.
+    
+    Args:
+        secret: Webhook HMAC secret
+        
+    Returns:
+        WebhookSigner: Signer with precomputed key state
+    """
+    return WebhookSigner(secret)
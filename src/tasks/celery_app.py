@@ -0,0 +1,27 @@
+"""
+Celery application for Turkish Business Integration Platform
+"""
+
+from celery import Celery
+
+from src.config import settings
+
+celery_app = Celery(
+    "turkplatform",
+    broker=settings.celery_broker_url or settings.redis_url,
+    include=["src.tasks.webhooks"]
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    task_ignore_result=True,
+    task_routes={"src.tasks.webhooks.*": {"queue": "webhooks"}},
+    timezone=settings.default_timezone,
+    # Publishers run on API workers; fail fast when the broker is unreachable
+    broker_connection_timeout=2,
+    broker_transport_options={"socket_connect_timeout": 2, "socket_timeout": 2}
+)
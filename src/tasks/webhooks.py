@@ -0,0 +1,75 @@
+"""
+Webhook delivery tasks for Turkish Business Integration Platform
+
+Deliveries run in Celery worker processes, so slow receivers never hold an
+API worker. Each worker process keeps one event loop and one pooled HTTP/2
+client for all deliveries it runs.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+
+from src.config import settings
+from src.services.tenant_service import tenant_service, WebhookDeliveryError
+from src.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+_runner: Optional[asyncio.Runner] = None
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _run(coro):
+    """Run a coroutine on this worker process's persistent event loop"""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner.run(coro)
+
+
+async def _deliver(delivery: Dict[str, Any]) -> None:
+    """Send one delivery through the process-wide HTTP client"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(settings.request_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.webhook_http_max_connections,
+                max_keepalive_connections=settings.webhook_http_max_keepalive
+            )
+        )
+    await tenant_service.send_webhook(client=_client, **delivery)
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(WebhookDeliveryError, httpx.TransportError),
+    max_retries=3,
+    retry_backoff=max(settings.webhook_retry_base_ms // 1000, 1),
+    retry_backoff_max=settings.webhook_retry_cap_ms // 1000,
+    retry_jitter=True
+)
+def send_webhook_task(self, **delivery: Any) -> None:
+    """
+    Deliver a webhook, retrying with capped, jittered exponential backoff
+    
+    Only receiver 429/5xx answers and transport errors are retried; any
+    other failure is logged once and dropped.
+    
+    Args:
+        **delivery: Keyword arguments for tenant_service.send_webhook
+    """
+    try:
+        _run(_deliver(delivery))
+    except Exception as e:
+        logger.error(
+            "Webhook delivery failed",
+            webhook_id=str(delivery.get("webhook_id")),
+            attempt=self.request.retries + 1,
+            error=str(e)
+        )
+        raise
@@ -2,14 +2,41 @@
 Monitoring utilities for Turkish Business Integration Platform
 """
 
+import asyncio
 import time
 from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+import psutil
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Seconds each background CPU sample is measured over
+CPU_SAMPLE_INTERVAL_SECONDS = 5.0
+
+# Latest system-wide CPU usage from sample_cpu_usage
+_cpu_percent = 0.0
+
+
+async def sample_cpu_usage() -> None:
+    """
+    Keep a system-wide CPU usage sample fresh in the background
+    
+    Each sample blocks a worker thread, never the event loop, for
+    CPU_SAMPLE_INTERVAL_SECONDS; health endpoints read the cached value.
+    Runs until cancelled.
+    """
+    global _cpu_percent
+    while True:
+        _cpu_percent = await asyncio.to_thread(psutil.cpu_percent, CPU_SAMPLE_INTERVAL_SECONDS)
+
+
+def get_cpu_percent() -> float:
+    """Latest sampled system-wide CPU usage percentage"""
+    return _cpu_percent
+
+
 def setup_monitoring():
     """Setup monitoring configuration"""
     logger.info("Monitoring setup completed")